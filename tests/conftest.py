@@ -0,0 +1,109 @@
+"""Shared fixtures: an in-memory stand-in for the TickTick Open API."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+
+import httpx
+import orjson
+import pytest
+
+import ticktui.api as api
+
+
+class FakeTickTick:
+    """Serves /open/v1 project and task endpoints from in-memory data.
+
+    Clearing `writes_open` holds every POST/DELETE until it is set again,
+    so tests can look at the UI's optimistic state before the API answers.
+    Project data carries an ETag and answers a matching If-None-Match with
+    304, counted in `not_modified`. Creating a task titled one of
+    `rejected_titles` fails with a 500.
+    """
+    
+    def __init__(self) -> None:
+        self.projects = [
+            {"id": "inbox1", "name": "Inbox"},
+            {"id": "p1", "name": "Work", "groupId": "g1"},
+        ]
+        self.tasks: dict[str, list[dict]] = {"inbox1": [], "p1": []}
+        self.calls: list[tuple[str, str]] = []
+        self.token_responses: list[dict] = []
+        self.not_modified = 0
+        self.rejected_titles: set[str] = set()
+        self.writes_open = asyncio.Event()
+        self.writes_open.set()
+        self._next_id = 0
+    
+    def add_task(self, project_id: str, task_id: str, title: str, **fields) -> None:
+        self.tasks[project_id].append({"id": task_id, "title": title, "projectId": project_id, **fields})
+    
+    def _find(self, project_id: str, task_id: str) -> dict | None:
+        return next((t for t in self.tasks.get(project_id, []) if t["id"] == task_id), None)
+    
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "ticktick.com":
+            self.calls.append((request.method, request.url.path))
+            return httpx.Response(200, json=self.token_responses.pop(0))
+        
+        path = request.url.path.removeprefix("/open/v1")
+        self.calls.append((request.method, path))
+        if request.method != "GET":
+            await self.writes_open.wait()
+        parts = path.strip("/").split("/")
+        
+        if request.method == "GET":
+            if path == "/project":
+                return httpx.Response(200, json=self.projects)
+            if path == "/project/group":
+                return httpx.Response(200, json=[{"id": "g1", "name": "Jobs"}])
+            if len(parts) == 3 and parts[2] == "data":
+                body = orjson.dumps({"tasks": self.tasks.get(parts[1], [])})
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if request.headers.get("If-None-Match") == etag:
+                    self.not_modified += 1
+                    return httpx.Response(304, headers={"ETag": etag})
+                return httpx.Response(200, content=body, headers={"ETag": etag})
+            if len(parts) == 4 and (task := self._find(parts[1], parts[3])):
+                return httpx.Response(200, json=task)
+        elif request.method == "POST" and parts == ["task"]:
+            body = orjson.loads(request.content)
+            if body["title"] in self.rejected_titles:
+                return httpx.Response(500)
+            self._next_id += 1
+            task = {**body, "id": f"new{self._next_id}"}
+            self.tasks.setdefault(task["projectId"], []).append(task)
+            return httpx.Response(200, json=task)
+        elif request.method == "POST" and parts[0] == "task":
+            body = orjson.loads(request.content)
+            for project_id, tasks in self.tasks.items():
+                if task := self._find(project_id, parts[1]):
+                    # A changed projectId moves the task to that project.
+                    tasks.remove(task)
+                    task.update(body)
+                    self.tasks.setdefault(task["projectId"], []).append(task)
+                    return httpx.Response(200, json=task)
+        elif request.method == "POST" and parts[-1] == "complete":
+            if task := self._find(parts[1], parts[3]):
+                task["status"] = 2
+                return httpx.Response(200)
+        elif request.method == "DELETE":
+            if task := self._find(parts[1], parts[3]):
+                self.tasks[parts[1]].remove(task)
+                return httpx.Response(200)
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def fake_api(monkeypatch, tmp_path) -> FakeTickTick:
+    """Route every HTTP client the package creates to a FakeTickTick."""
+    fake = FakeTickTick()
+    
+    def new_http_client(**kwargs) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(fake.handle), **kwargs)
+    
+    monkeypatch.setattr(api, "_new_http_client", new_http_client)
+    # Keep TokenStorage() defaults out of the real home directory.
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return fake
@@ -0,0 +1,73 @@
+"""TickTickClient keeps its cached tags in step with the API."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+
+from ticktui.api import TickTickAuth, TickTickClient
+
+
+def run_client(scenario) -> None:
+    """Run `scenario(client)` against a client logged in to the fake API."""
+    async def main() -> None:
+        auth = TickTickAuth("", "")
+        auth.access_token = "tok"
+        client = TickTickClient(auth)
+        try:
+            await scenario(client)
+        finally:
+            await client.close()
+    
+    asyncio.run(main())
+
+
+def test_deleted_task_tags_are_dropped(fake_api):
+    fake_api.add_task("p1", "t1", "A", tags=["home"])
+    fake_api.add_task("p1", "t2", "B", tags=["work"])
+    
+    async def scenario(client: TickTickClient) -> None:
+        assert await client.get_tags() == ["home", "work"]
+        await client.delete_task("p1", "t1")
+        assert await client.get_tags() == ["work"]
+    
+    run_client(scenario)
+
+
+def test_removed_tag_is_dropped(fake_api):
+    fake_api.add_task("p1", "t1", "A", tags=["home", "work"])
+    
+    async def scenario(client: TickTickClient) -> None:
+        (task,) = await client.get_project_tasks("p1")
+        await client.update_task(dataclasses.replace(task, tags=["work"]))
+        assert await client.get_tags() == ["work"]
+    
+    run_client(scenario)
+
+
+def test_moved_task_leaves_its_old_project(fake_api):
+    fake_api.add_task("p1", "t1", "A", tags=["home"])
+    
+    async def scenario(client: TickTickClient) -> None:
+        (task,) = await client.get_project_tasks("p1")
+        await client.get_project_tasks("inbox1")
+        await client.update_task(dataclasses.replace(task, project_id="inbox1"))
+        assert await client.get_project_tasks("p1") == []
+        assert [t.id for t in await client.get_project_tasks("inbox1")] == ["t1"]
+        assert await client.get_tags() == ["home"]
+        await client.update_task(dataclasses.replace(task, project_id="inbox1", tags=["work"]))
+        assert await client.get_tags() == ["work"]
+    
+    run_client(scenario)
+
+
+def test_not_modified_project_keeps_its_tags(fake_api):
+    fake_api.add_task("p1", "t1", "A", tags=["work"])
+    
+    async def scenario(client: TickTickClient) -> None:
+        assert await client.get_tags() == ["work"]
+        client.invalidate_tasks()
+        assert await client.get_tags() == ["work"]
+        assert fake_api.not_modified == 2
+    
+    run_client(scenario)
@@ -0,0 +1,178 @@
+"""TickTUIApp: selection stays in step with the task list; tokens persist."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+from textual.widgets import ListView
+
+from ticktui.app import MainScreen, SidebarSectionItem, TaskItem, TickTUIApp
+from ticktui.api import TokenStorage
+
+
+def run_app(fake_api, tmp_path, scenario, saved: tuple = ("tok",)) -> None:
+    """Run `scenario(pilot, screen)` against the app logged in to `fake_api`.
+
+    `saved` is what the token file holds (TokenStorage.save's arguments).
+    """
+    async def main() -> None:
+        app = TickTUIApp()
+        app.token_storage = TokenStorage(str(tmp_path / "tokens.json"))
+        app.token_storage.save(*saved)
+        async with app.run_test(size=(160, 50)) as pilot:
+            await pilot.pause(0.3)
+            assert isinstance(app.screen, MainScreen)
+            try:
+                await scenario(pilot, app.screen)
+            finally:
+                # The app waits for held writes before it exits.
+                fake_api.writes_open.set()
+    
+    asyncio.run(main())
+
+
+async def open_section(pilot, screen: MainScreen, key: str) -> None:
+    projects = screen.query_one("#projects-list", ListView)
+    for index, item in enumerate(projects.children):
+        if isinstance(item, SidebarSectionItem) and item.section.key == key:
+            projects.focus()
+            projects.index = index
+            await pilot.press("enter")
+            await pilot.pause(0.3)
+            return
+    raise AssertionError(f"no sidebar section {key!r}")
+
+
+async def select_task(pilot, screen: MainScreen, title: str) -> None:
+    tasks_list = screen.query_one("#tasks-list", ListView)
+    tasks_list.focus()
+    titles = [item.task_data.title for item in tasks_list.children]
+    tasks_list.index = titles.index(title)
+    await pilot.pause()
+
+
+def selection(screen: MainScreen) -> tuple[list[str], str | None]:
+    """Return the titles of highlighted rows and of the selected task.
+
+    Also checks that ListView.index points at the highlighted row.
+    """
+    tasks_list = screen.query_one("#tasks-list", ListView)
+    highlighted = [item for item in tasks_list.children if item.highlighted]
+    if highlighted:
+        assert tasks_list.children[tasks_list.index] is highlighted[0]
+    titles = [item.task_data.title for item in highlighted if isinstance(item, TaskItem)]
+    current = screen.current_task.title if screen.current_task else None
+    return titles, current
+
+
+def row_titles(screen: MainScreen) -> list[str]:
+    tasks_list = screen.query_one("#tasks-list", ListView)
+    return [item.task_data.title for item in tasks_list.children if isinstance(item, TaskItem)]
+
+
+def test_switching_views_highlights_the_selected_task(fake_api, tmp_path):
+    fake_api.add_task("inbox1", "a", "A", dueDate=f"{date.today().isoformat()}T00:00:00.000+0000")
+    fake_api.add_task("inbox1", "b", "B", priority=5)
+    
+    async def scenario(pilot, screen):
+        await open_section(pilot, screen, "today")
+        assert selection(screen) == (["A"], "A")
+        # A's row is reused and moves below B; B must be both shown and acted on.
+        await open_section(pilot, screen, "inbox")
+        assert row_titles(screen) == ["B", "A"]
+        assert selection(screen) == (["B"], "B")
+    
+    run_app(fake_api, tmp_path, scenario)
+
+
+def test_reloading_a_view_keeps_the_selected_task(fake_api, tmp_path):
+    fake_api.add_task("inbox1", "a", "A")
+    
+    async def scenario(pilot, screen):
+        await open_section(pilot, screen, "inbox")
+        assert selection(screen) == (["A"], "A")
+        # B's row is inserted above A's; A stays both shown and acted on.
+        fake_api.add_task("inbox1", "b", "B", priority=5)
+        screen.app.client.invalidate_tasks()
+        await open_section(pilot, screen, "inbox")
+        assert row_titles(screen) == ["B", "A"]
+        assert selection(screen) == (["A"], "A")
+    
+    run_app(fake_api, tmp_path, scenario)
+
+
+def test_local_complete_keeps_the_task_selected(fake_api, tmp_path):
+    for task_id, title in (("x", "X"), ("y", "Y"), ("z", "Z")):
+        fake_api.add_task("p1", task_id, title)
+    
+    async def scenario(pilot, screen):
+        await open_section(pilot, screen, "p1")
+        await select_task(pilot, screen, "Y")
+        fake_api.writes_open.clear()
+        await pilot.press("c")
+        await pilot.pause(0.1)
+        assert row_titles(screen) == ["X", "Z", "Y"]
+        assert selection(screen) == (["Y"], "Y")
+        fake_api.writes_open.set()
+        await pilot.pause(0.3)
+        assert selection(screen) == (["Y"], "Y")
+    
+    run_app(fake_api, tmp_path, scenario)
+
+
+def test_local_delete_selects_the_next_task(fake_api, tmp_path):
+    for task_id, title in (("x", "X"), ("y", "Y"), ("z", "Z")):
+        fake_api.add_task("p1", task_id, title)
+    
+    async def scenario(pilot, screen):
+        await open_section(pilot, screen, "p1")
+        await select_task(pilot, screen, "Y")
+        fake_api.writes_open.clear()
+        await pilot.press("d")
+        await pilot.pause(0.1)
+        await pilot.press("y")
+        await pilot.pause(0.1)
+        assert row_titles(screen) == ["X", "Z"]
+        assert selection(screen) == (["Z"], "Z")
+    
+    run_app(fake_api, tmp_path, scenario)
+
+
+def test_local_create_keeps_the_selection_and_each_stub(fake_api, tmp_path):
+    for task_id, title in (("x", "X"), ("y", "Y")):
+        fake_api.add_task("p1", task_id, title)
+    
+    async def scenario(pilot, screen):
+        await open_section(pilot, screen, "p1")
+        await select_task(pilot, screen, "Y")
+        fake_api.writes_open.clear()
+        for title in ("N1", "N2"):
+            await pilot.press("n")
+            await pilot.pause(0.1)
+            await pilot.press(*title)
+            await pilot.click("#create")
+            await pilot.pause(0.1)
+        # Both id-less stubs get their own row.
+        assert row_titles(screen) == ["X", "Y", "N1", "N2"]
+        assert selection(screen) == (["Y"], "Y")
+    
+    run_app(fake_api, tmp_path, scenario)
+
+
+def test_restored_session_refreshes_and_saves_tokens(fake_api, tmp_path):
+    expired = datetime.now(timezone.utc) - timedelta(minutes=1)
+    fake_api.token_responses.append(
+        {"access_token": "new", "refresh_token": "new-refresh", "expires_in": 3600}
+    )
+    
+    async def scenario(pilot, screen) -> None:
+        assert row_titles(screen) == []
+    
+    run_app(fake_api, tmp_path, scenario, saved=("old", "old-refresh", expired, "id", "secret"))
+    # Every request waited on one refresh.
+    assert fake_api.calls.count(("POST", "/oauth/token")) == 1
+    saved = TokenStorage(str(tmp_path / "tokens.json")).load()
+    assert (saved["access_token"], saved["refresh_token"]) == ("new", "new-refresh")
+    assert saved["expiry"] > datetime.now(timezone.utc)
+    assert (saved["client_id"], saved["client_secret"]) == ("id", "secret")
@@ -0,0 +1,133 @@
+"""The CLI commands, run through main() against the fake API."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+
+from ticktui import cli
+from ticktui.api import TokenStorage
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokens(monkeypatch) -> None:
+    """Re-read the token file in every test rather than once per process."""
+    monkeypatch.setattr(cli, "_TOKENS", None)
+
+
+@pytest.fixture
+def logged_in(fake_api) -> None:
+    TokenStorage().save("tok")
+
+
+def run_cli(*argv: str) -> int:
+    """Run the CLI with `argv` and return its exit status."""
+    with pytest.raises(SystemExit) as exc:
+        cli.main(list(argv))
+    return exc.value.code
+
+
+def test_restored_session_refreshes_and_saves_tokens(fake_api, capsys):
+    expired = datetime.now(timezone.utc) - timedelta(minutes=1)
+    TokenStorage().save("old", "old-refresh", expired, "id", "secret")
+    fake_api.token_responses.append(
+        {"access_token": "new", "refresh_token": "new-refresh", "expires_in": 3600}
+    )
+
+    assert run_cli("lists", "list") == cli.EXIT_OK
+    assert capsys.readouterr().out == "inbox1  Inbox\np1  Work\n"
+    saved = TokenStorage().load()
+    assert (saved["access_token"], saved["refresh_token"]) == ("new", "new-refresh")
+    assert (saved["client_id"], saved["client_secret"]) == ("id", "secret")
+    assert cli._TOKENS == saved
+
+
+def test_expired_token_without_credentials_fails(fake_api, capsys):
+    TokenStorage().save("old", "old-refresh", datetime.now(timezone.utc) - timedelta(minutes=1))
+
+    assert run_cli("lists", "list") == cli.EXIT_ERROR
+    assert "expired" in capsys.readouterr().out
+    assert fake_api.calls == []
+
+
+def test_project_id_skips_the_project_scan(fake_api, logged_in, capsys):
+    fake_api.add_task("p1", "t1", "A")
+    fake_api.add_task("p1", "t2", "B")
+    fake_api.add_task("p1", "t3", "C")
+
+    assert run_cli("tasks", "edit", "t1", "--title", "A2", "--project-id", "p1") == cli.EXIT_OK
+    assert run_cli("tasks", "complete", "t2", "--project-id", "p1") == cli.EXIT_OK
+    assert run_cli("tasks", "delete", "t3", "--project-id", "p1") == cli.EXIT_OK
+    assert capsys.readouterr().out == "t1\n"
+    # Only the named project is touched: no project list, no probing.
+    assert fake_api.calls == [
+        ("GET", "/project/p1/task/t1"),
+        ("POST", "/task/t1"),
+        ("POST", "/project/p1/task/t2/complete"),
+        ("DELETE", "/project/p1/task/t3"),
+    ]
+    assert {t["id"]: (t["title"], t.get("status")) for t in fake_api.tasks["p1"]} == {
+        "t1": ("A2", None),
+        "t2": ("B", 2),
+    }
+
+
+def test_without_project_id_the_task_is_found_by_scanning(fake_api, logged_in):
+    fake_api.add_task("p1", "t1", "A")
+
+    assert run_cli("tasks", "complete", "t1") == cli.EXIT_OK
+    assert ("GET", "/project") in fake_api.calls
+    assert fake_api.calls[-1] == ("POST", "/project/p1/task/t1/complete")
+
+
+def test_tasks_add_prints_one_id_per_title_in_order(fake_api, logged_in, tmp_path, capsys):
+    titles_file = tmp_path / "titles.txt"
+    titles_file.write_text("C\n\n  D  \n", encoding="utf-8")
+
+    assert run_cli("tasks", "add", "A", "B", "--from-file", str(titles_file), "--list", "Work") == cli.EXIT_OK
+    titles = {t["id"]: t["title"] for t in fake_api.tasks["p1"]}
+    assert [titles[i] for i in capsys.readouterr().out.splitlines()] == ["A", "B", "C", "D"]
+
+
+def test_tasks_add_reports_each_failed_title(fake_api, logged_in, capsys):
+    fake_api.rejected_titles.add("B")
+
+    assert run_cli("tasks", "add", "A", "B", "C", "--list", "Work") == cli.EXIT_ERROR
+    first, failed, last = capsys.readouterr().out.splitlines()
+    assert failed.startswith("Error: could not create 'B': ")
+    titles = {t["id"]: t["title"] for t in fake_api.tasks["p1"]}
+    assert [titles[first], titles[last]] == ["A", "C"]
+
+
+def test_tasks_add_needs_a_title(fake_api, logged_in, capsys):
+    assert run_cli("tasks", "add", "--list", "Work") == cli.EXIT_ERROR
+    assert capsys.readouterr().out == "Error: No task titles given\n"
+    assert fake_api.calls == []
+
+
+def test_json_output_leaves_out_internal_fields(fake_api, logged_in, capsys):
+    fake_api.add_task("p1", "t1", "A", dueDate="2026-01-02T03:04:05.000+0000", tags=["x"])
+
+    assert run_cli("tasks", "list", "--json") == cli.EXIT_OK
+    (task,) = orjson.loads(capsys.readouterr().out)
+    assert (task["id"], task["title"], task["tags"]) == ("t1", "A", ["x"])
+    assert task["due_date"] == "2026-01-02T03:04:05+00:00"
+    # Task keeps the raw API date strings in _raw_* fields.
+    assert not [key for key in task if key.startswith("_")]
+
+    assert run_cli("lists", "list", "--json") == cli.EXIT_OK
+    projects = orjson.loads(capsys.readouterr().out)
+    assert [(p["id"], p["name"]) for p in projects] == [("inbox1", "Inbox"), ("p1", "Work")]
+
+
+def test_parser_is_built_once_per_command_group(fake_api, logged_in, capsys):
+    fake_api.add_task("p1", "t1", "A")
+    cli.build_parser.cache_clear()
+
+    assert run_cli("tasks", "list", "--json") == cli.EXIT_OK
+    assert run_cli("tasks", "list") == cli.EXIT_OK
+    assert cli.build_parser.cache_info()[:2] == (1, 1)  # (hits, misses)
+    # The reused parser doesn't carry options over from the earlier run.
+    assert capsys.readouterr().out.splitlines()[1:] == ["[ ] t1  A  "]
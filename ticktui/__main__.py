@@ -13,26 +13,18 @@ import sys
 
 
 def main() -> None:
-    # No args should keep the quick path to the TUI.
     argv = sys.argv[1:]
 
-    if not argv:
-        from ticktui.app import main as tui_main
-
-        tui_main()
-        return
-
-    # Any non-option first token means a CLI subcommand.
+    # A non-option first token means a CLI subcommand; no args or
+    # option-only invocations keep the quick path to the TUI.
     if argv and not argv[0].startswith("-"):
         from ticktui.cli import main as cli_main
 
         cli_main(argv)
-        return
-
-    # Fallback: keep TUI behavior for option-only invocations.
-    from ticktui.app import main as tui_main
+    else:
+        from ticktui.app import main as tui_main
 
-    tui_main()
+        tui_main()
 
 
 if __name__ == "__main__":
@@ -1,17 +1,74 @@
-"""TickTick API Client using official REST endpoints."""
+"""TickTick API Client using official REST endpoints.
 
-import httpx
+httpx is imported lazily inside the methods that talk to the network, so
+importing this module (e.g. for CLI `--help`) stays cheap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
 import secrets
 import base64
 from urllib.parse import urlencode
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+import orjson
 import os
-import json
+import time
+
+if TYPE_CHECKING:
+    import httpx
+
+
+_PRIORITY_LABELS = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
+
+
+def _parse_json(response: httpx.Response):
+    """Decode a JSON response body (always UTF-8 bytes) with orjson."""
+    return orjson.loads(response.content)
+
+
+def _new_http_client(**kwargs) -> httpx.AsyncClient:
+    """Create an HTTP/2 client with the shared keep-alive pool settings."""
+    import httpx
+
+    return httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=TickTickClient.MAX_CONNECTIONS,
+            max_keepalive_connections=TickTickClient.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=30.0,
+        ),
+        **kwargs,
+    )
 
 
-@dataclass
+def _norm_name(name: object) -> str:
+    """Normalize a project/group name for case-insensitive lookups."""
+    return str(name).strip().casefold()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
+    """Parse a TickTick date string.
+
+    TickTick returns the same handful of timestamps across refreshes, so
+    results are memoized (datetimes are immutable and safe to share).
+    """
+    if not date_str:
+        return None
+    try:
+        # Since Python 3.11 fromisoformat accepts both "Z" and "+0000" offsets.
+        return datetime.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a TickTick task."""
     id: str
@@ -23,42 +80,38 @@ class Task:
     due_date: Optional[datetime] = None
     start_date: Optional[datetime] = None
     is_all_day: bool = False
-    tags: Optional[list[str]] = None
-    items: Optional[list[dict]] = None  # Subtasks/checklist items
-    
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
-        if self.items is None:
-            self.items = []
+    tags: list[str] = field(default_factory=list)
+    items: list[dict] = field(default_factory=list)  # Subtasks/checklist items
+    # (parsed, original) API date strings, reused by to_api while the parsed
+    # datetime is still the one assigned to due_date/start_date.
+    _raw_due: Optional[tuple[datetime, str]] = field(default=None, init=False, repr=False, compare=False)
+    _raw_start: Optional[tuple[datetime, str]] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_api(cls, data: dict) -> "Task":
-        """Create a Task from API response data."""
-        return cls(
-            id=data.get("id", ""),
-            title=data.get("title", ""),
-            project_id=data.get("projectId", ""),
-            content=data.get("content", ""),
-            priority=data.get("priority", 0),
-            status=data.get("status", 0),
-            due_date=cls._parse_date(data.get("dueDate")),
-            start_date=cls._parse_date(data.get("startDate")),
-            is_all_day=data.get("isAllDay", False),
-            tags=data.get("tags", []),
-            items=data.get("items", []),
-        )
-    
-    @staticmethod
-    def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
-        """Parse a TickTick date string."""
-        if not date_str:
-            return None
-        try:
-            # TickTick uses ISO format with timezone
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00").replace("+0000", "+00:00"))
-        except (ValueError, AttributeError):
-            return None
+        """Create a Task from API response data.
+
+        This is the bulk-load path, so it skips the generated `__init__` and
+        assigns fields directly.
+        """
+        g = data.get
+        parse = _parse_date
+        t = object.__new__(cls)
+        t.id = g("id", "")
+        t.title = g("title", "")
+        t.project_id = g("projectId", "")
+        t.content = g("content", "")
+        t.priority = g("priority", 0)
+        t.status = g("status", 0)
+        due_raw, start_raw = g("dueDate"), g("startDate")
+        t.due_date = due = parse(due_raw)
+        t.start_date = start = parse(start_raw)
+        t._raw_due = (due, due_raw) if due else None
+        t._raw_start = (start, start_raw) if start else None
+        t.is_all_day = g("isAllDay", False)
+        t.tags = g("tags") or []
+        t.items = g("items") or []
+        return t
     
     def to_api(self) -> dict:
         """Convert to API request format."""
@@ -68,20 +121,24 @@ class Task:
             "content": self.content,
             "priority": self.priority,
         }
-        if self.due_date:
-            data["dueDate"] = self.due_date.isoformat()
-        if self.start_date:
-            data["startDate"] = self.start_date.isoformat()
+        # Read each optional field once; only truthy ones are sent.
+        due_date, start_date, tags = self.due_date, self.start_date, self.tags
+        if due_date:
+            raw = self._raw_due
+            data["dueDate"] = raw[1] if raw and raw[0] is due_date else due_date.isoformat()
+        if start_date:
+            raw = self._raw_start
+            data["startDate"] = raw[1] if raw and raw[0] is start_date else start_date.isoformat()
         if self.is_all_day:
-            data["isAllDay"] = self.is_all_day
-        if self.tags:
-            data["tags"] = self.tags
+            data["isAllDay"] = True
+        if tags:
+            data["tags"] = tags
         return data
     
     @property
     def priority_label(self) -> str:
         """Get human-readable priority label."""
-        return {0: "None", 1: "Low", 3: "Medium", 5: "High"}.get(self.priority, "None")
+        return _PRIORITY_LABELS.get(self.priority, "None")
     
     @property
     def is_completed(self) -> bool:
@@ -89,7 +146,7 @@ class Task:
         return self.status == 2
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Represents a TickTick project (list)."""
     id: str
@@ -102,14 +159,15 @@ class Project:
     @classmethod
     def from_api(cls, data: dict) -> "Project":
         """Create a Project from API response data."""
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            color=data.get("color", ""),
-            closed=data.get("closed", False),
-            group_id=data.get("groupId"),
-            sort_order=data.get("sortOrder", 0),
-        )
+        g = data.get
+        p = object.__new__(cls)
+        p.id = g("id", "")
+        p.name = g("name", "")
+        p.color = g("color", "")
+        p.closed = g("closed", False)
+        p.group_id = g("groupId")
+        p.sort_order = g("sortOrder", 0)
+        return p
 
 
 class TickTickAuth:
@@ -117,14 +175,45 @@ class TickTickAuth:
     
     AUTHORIZE_URL = "https://ticktick.com/oauth/authorize"
     TOKEN_URL = "https://ticktick.com/oauth/token"
-    
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str = "http://localhost:8080/callback"):
+    # Refresh this long before the reported expiry.
+    REFRESH_MARGIN = timedelta(seconds=60)
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str = "http://localhost:8080/callback",
+        http_client: Optional[httpx.AsyncClient] = None,
+        on_refresh: Optional[Callable[["TickTickAuth"], None]] = None,
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        # Credentials don't change, so encode the Basic auth header once.
+        credentials = f"{client_id}:{client_secret}"
+        self._token_headers = {
+            "Authorization": "Basic " + base64.b64encode(credentials.encode()).decode(),
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        # Constant tail of the code-exchange form body.
+        self._redirect_param = urlencode({"redirect_uri": redirect_uri})
+        # Everything but the state is fixed, so the query string is encoded once.
+        self._authorize_url_prefix = f"{self.AUTHORIZE_URL}?" + urlencode({
+            "client_id": client_id,
+            "redirect_uri": redirect_uri,
+            "response_type": "code",
+            "scope": "tasks:read tasks:write",
+        })
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        # Serializes refreshes so concurrent requests share one token round-trip.
+        self._refresh_lock = asyncio.Lock()
+        # Token requests reuse one pooled client; we only close it if we made it.
+        self._http_client = http_client
+        self._owns_http_client = False
+        # Called after each successful refresh, e.g. to persist the new tokens.
+        self.on_refresh = on_refresh
     
     @property
     def access_token(self) -> Optional[str]:
@@ -134,6 +223,67 @@ class TickTickAuth:
     def access_token(self, value: str):
         self._access_token = value
     
+    @property
+    def refresh_token(self) -> Optional[str]:
+        return self._refresh_token
+    
+    @refresh_token.setter
+    def refresh_token(self, value: Optional[str]):
+        self._refresh_token = value
+    
+    @property
+    def token_expiry(self) -> Optional[datetime]:
+        return self._token_expiry
+    
+    @token_expiry.setter
+    def token_expiry(self, value: Optional[datetime]):
+        self._token_expiry = value
+    
+    @property
+    def token_expired(self) -> bool:
+        """Whether the access token is known to have expired."""
+        return self._token_expiry is not None and datetime.now(timezone.utc) >= self._token_expiry
+    
+    @property
+    def can_refresh(self) -> bool:
+        """Whether there is a refresh token and a client secret to use it with."""
+        return bool(self._refresh_token and self.client_secret)
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the client used for token requests, creating it on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = _new_http_client()
+            self._owns_http_client = True
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the token-request client if this object created it."""
+        if self._owns_http_client and self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+    
+    def _set_expiry(self, token_data: dict) -> None:
+        expires_in = token_data.get("expires_in")
+        if isinstance(expires_in, (int, float)):
+            self._token_expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+    
+    def _token_is_fresh(self) -> bool:
+        if self._token_expiry is None:
+            return True
+        return datetime.now(timezone.utc) + self.REFRESH_MARGIN < self._token_expiry
+    
+    async def ensure_fresh_token(self) -> None:
+        """Refresh the access token if it is about to expire.
+
+        Only one refresh runs at a time; callers that were waiting on the lock
+        see the new expiry and return without refreshing again.
+        """
+        if not self.can_refresh or self._token_is_fresh():
+            return
+        async with self._refresh_lock:
+            if self._token_is_fresh():
+                return
+            await self.refresh_access_token()
+    
     def get_authorization_url(self, state: Optional[str] = None) -> tuple[str, str]:
         """Generate the OAuth2 authorization URL.
         
@@ -143,72 +293,52 @@ class TickTickAuth:
         if state is None:
             state = secrets.token_urlsafe(32)
         
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "response_type": "code",
-            "scope": "tasks:read tasks:write",
-            "state": state,
-        }
-        
-        url = f"{self.AUTHORIZE_URL}?{urlencode(params)}"
+        url = f"{self._authorize_url_prefix}&{urlencode({'state': state})}"
         return url, state
     
     async def exchange_code(self, code: str) -> dict:
         """Exchange authorization code for access token."""
-        async with httpx.AsyncClient() as client:
-            # Create basic auth header
-            credentials = f"{self.client_id}:{self.client_secret}"
-            basic_auth = base64.b64encode(credentials.encode()).decode()
-            
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "grant_type": "authorization_code",
-                    "code": code,
-                    "redirect_uri": self.redirect_uri,
-                },
-                headers={
-                    "Authorization": f"Basic {basic_auth}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-            )
-            response.raise_for_status()
-            token_data = response.json()
-            
-            self._access_token = token_data.get("access_token")
-            self._refresh_token = token_data.get("refresh_token")
-            
-            return token_data
+        client = self._get_http_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            content=(
+                f"grant_type=authorization_code&{urlencode({'code': code})}&{self._redirect_param}"
+            ).encode(),
+            headers=self._token_headers,
+        )
+        response.raise_for_status()
+        token_data = _parse_json(response)
+        
+        self._access_token = token_data.get("access_token")
+        self._refresh_token = token_data.get("refresh_token")
+        self._set_expiry(token_data)
+        
+        return token_data
     
     async def refresh_access_token(self) -> dict:
         """Refresh the access token using refresh token."""
         if not self._refresh_token:
             raise ValueError("No refresh token available")
         
-        async with httpx.AsyncClient() as client:
-            credentials = f"{self.client_id}:{self.client_secret}"
-            basic_auth = base64.b64encode(credentials.encode()).decode()
-            
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self._refresh_token,
-                },
-                headers={
-                    "Authorization": f"Basic {basic_auth}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-            )
-            response.raise_for_status()
-            token_data = response.json()
-            
-            self._access_token = token_data.get("access_token")
-            if "refresh_token" in token_data:
-                self._refresh_token = token_data.get("refresh_token")
-            
-            return token_data
+        client = self._get_http_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            content=(
+                "grant_type=refresh_token&" + urlencode({"refresh_token": self._refresh_token})
+            ).encode(),
+            headers=self._token_headers,
+        )
+        response.raise_for_status()
+        token_data = _parse_json(response)
+        
+        self._access_token = token_data.get("access_token")
+        if "refresh_token" in token_data:
+            self._refresh_token = token_data.get("refresh_token")
+        self._set_expiry(token_data)
+        if self.on_refresh is not None:
+            self.on_refresh(self)
+        
+        return token_data
 
 
 class TickTickClient:
@@ -216,46 +346,160 @@ class TickTickClient:
     
     BASE_URL = "https://api.ticktick.com"
     OPEN_API_URL = "https://api.ticktick.com/open/v1"
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    PROJECTS_TTL = 60.0
+    TASKS_TTL = 15.0
+    
+    # Endpoint paths, relative to OPEN_API_URL (the client's base_url).
+    _PROJECT_URL = "/project/%s"
+    _PROJECT_DATA_URL = "/project/%s/data"
+    _TASK_URL = "/project/%s/task/%s"
+    _TASK_COMPLETE_URL = "/project/%s/task/%s/complete"
+    _TASK_UPDATE_URL = "/task/%s"
     
     def __init__(self, auth: TickTickAuth):
         self.auth = auth
         self._client: Optional[httpx.AsyncClient] = None
-    
-    @property
-    def _headers(self) -> dict:
-        """Get request headers with authorization."""
-        return {
-            "Authorization": f"Bearer {self.auth.access_token}",
-            "Content-Type": "application/json",
-        }
+        # Token currently baked into the client's Authorization header
+        self._header_token: Optional[str] = None
+        # Caps concurrent per-project requests across all fan-out helpers so
+        # overlapping calls stay within the keep-alive pool.
+        self._fan_out_slots = asyncio.Semaphore(self.MAX_KEEPALIVE_CONNECTIONS)
+        # (fetched_at, value) pairs keyed off time.monotonic()
+        self._projects_cache: tuple[float, list[Project]] | None = None
+        # Normalized name -> project / group id, rebuilt with their caches
+        self._projects_by_name: dict[str, Project] = {}
+        self._groups_cache: tuple[float, list[dict]] | None = None
+        self._group_ids_by_name: dict[str, str] = {}
+        self._tasks_cache: dict[str, tuple[float, list[Task]]] = {}
+        # project_id -> (ETag, raw task dicts, their tags) for conditional GETs
+        self._project_etags: dict[str, tuple[str, list[dict], frozenset[str]]] = {}
+        # Unique tag names per project, gathered in get_project_tasks and
+        # rebuilt from the cached list when a task mutation changes it
+        self._project_tags: dict[str, set[str]] = {}
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
+        """Get or create the shared, keep-alive pooled HTTP client.
+
+        The Authorization header is updated in place if the token changed.
+        """
+        token = self.auth.access_token
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = _new_http_client(
+                base_url=self.OPEN_API_URL,
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json",
+                },
+            )
+            self._header_token = token
+        elif token is not self._header_token:
+            self._client.headers["Authorization"] = f"Bearer {token}"
+            self._header_token = token
         return self._client
     
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared client, refreshing the token first if due."""
+        await self.auth.ensure_fresh_token()
+        client = await self._get_client()
+        return await client.request(method, url, **kwargs)
+    
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
+        await self.auth.aclose()
+
+    def invalidate_projects(self) -> None:
+        """Drop cached projects and groups so the next read hits the API."""
+        self._projects_cache = None
+        self._projects_by_name = {}
+        self._groups_cache = None
+        self._group_ids_by_name = {}
+
+    def invalidate_tasks(self, project_id: str | None = None) -> None:
+        """Drop cached task lists for one project, or for all projects."""
+        if project_id is None:
+            self._tasks_cache.clear()
+            self._project_tags.clear()
+        else:
+            self._tasks_cache.pop(project_id, None)
+            self._project_tags.pop(project_id, None)
+
+    def _cached_project_tasks(self, project_id: str) -> list[Task] | None:
+        """Return the project's cached task list if it is still fresh."""
+        cached = self._tasks_cache.get(project_id)
+        if cached and time.monotonic() - cached[0] < self.TASKS_TTL:
+            return cached[1]
+        return None
+
+    def _cache_task(self, task: Task) -> None:
+        """Insert or replace a task in its project's cached list, if any.
+
+        A task moved from another project is dropped from that project's list.
+        """
+        for project_id, (_, tasks) in self._tasks_cache.items():
+            if project_id == task.project_id:
+                continue
+            for i, t in enumerate(tasks):
+                if t.id == task.id:
+                    del tasks[i]
+                    self._refresh_project_tags(project_id)
+                    break
+        cached = self._tasks_cache.get(task.project_id)
+        if cached is not None:
+            tasks = cached[1]
+            for i, t in enumerate(tasks):
+                if t.id == task.id:
+                    tasks[i] = task
+                    break
+            else:
+                tasks.append(task)
+        self._refresh_project_tags(task.project_id)
+
+    def _refresh_project_tags(self, project_id: str) -> None:
+        """Rebuild a project's tag set from its cached tasks.
+
+        Without a cached list the set is dropped, so the next `get_tags`
+        refetches the project instead of reporting stale tags.
+        """
+        cached = self._tasks_cache.get(project_id)
+        if cached is None:
+            self._project_tags.pop(project_id, None)
+            return
+        self._project_tags[project_id] = {
+            tag.strip()
+            for t in cached[1]
+            for tag in t.tags
+            if isinstance(tag, str) and tag.strip()
+        }
+
+    def _find_cached_task(self, project_id: str, task_id: str) -> tuple[list[Task], int] | None:
+        cached = self._tasks_cache.get(project_id)
+        if cached is None:
+            return None
+        tasks = cached[1]
+        for i, t in enumerate(tasks):
+            if t.id == task_id:
+                return tasks, i
+        return None
 
     # ---- CLI convenience helpers (best-effort) ----
     async def resolve_project_by_name(self, name: str) -> Project:
         """Resolve a project by case-insensitive name."""
-        name_norm = name.strip().casefold()
-        projects = await self.get_projects()
-        for p in projects:
-            if p.name.strip().casefold() == name_norm:
-                return p
-        raise ValueError(f"Unknown list/project: {name}")
+        await self.get_projects()
+        project = self._projects_by_name.get(_norm_name(name))
+        if project is None:
+            raise ValueError(f"Unknown list/project: {name}")
+        return project
 
     async def resolve_inbox_project(self) -> Project:
         """Best-effort attempt to find TickTick's built-in Inbox project."""
         projects = await self.get_projects()
-        for p in projects:
-            if p.name.strip().casefold() == "inbox":
-                return p
+        inbox = self._projects_by_name.get("inbox")
+        if inbox is not None:
+            return inbox
         # Fallback: many accounts always have an Inbox-like first project
         if projects:
             return projects[0]
@@ -267,30 +511,85 @@ class TickTickClient:
         This is less efficient than keeping project_id around, but it's handy
         for CLI commands where only a task id is provided.
         """
+        from httpx import HTTPStatusError
+
         projects = await self.get_projects()
-        last_error: Exception | None = None
+        get_task = self.get_task
+        cached_tasks = self._cached_project_tasks
+
+        # If a fresh cached task list already holds this id, go straight to
+        # its project instead of probing every project.
         for project in projects:
-            try:
-                return await self.get_task(project.id, task_id)
-            except httpx.HTTPStatusError as e:
-                # 404 (or other) in a project means "not here".
-                last_error = e
-                continue
+            cached = cached_tasks(project.id)
+            if cached and any(t.id == task_id for t in cached):
+                try:
+                    return await get_task(project.id, task_id)
+                except HTTPStatusError:
+                    # Moved or deleted since it was cached; probe everywhere.
+                    break
+
+        async def lookup(project: Project) -> Task:
+            async with self._fan_out_slots:
+                return await get_task(project.id, task_id)
+
+        # Probe all projects concurrently and keep the first hit.
+        pending = [asyncio.ensure_future(lookup(p)) for p in projects]
+        last_error: Exception | None = None
+        try:
+            for next_done in asyncio.as_completed(pending):
+                try:
+                    return await next_done
+                except HTTPStatusError as e:
+                    # 404 (or other) in a project means "not here".
+                    last_error = e
+                    continue
+        finally:
+            for fut in pending:
+                fut.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         if last_error:
             raise ValueError(f"Task not found: {task_id}") from last_error
         raise ValueError(f"Task not found: {task_id}")
 
     async def get_tasks_for_today(self, include_completed: bool = False) -> list[Task]:
-        """Return tasks whose due date is today (local date)."""
-        all_tasks = await self.get_all_tasks()
+        """Return tasks whose due date is today (local date).
+
+        Uncached projects are filtered on the raw payload: the date part of an
+        ISO `dueDate` string is a cheap prefix check, so only matching rows are
+        turned into Task objects.
+        """
+        from httpx import HTTPStatusError
+
+        projects = await self.get_projects()
         today = datetime.now().date()
-        out: list[Task] = []
-        for t in all_tasks:
+        prefix = today.isoformat()
+
+        def keep(t: Task) -> bool:
             if not include_completed and t.is_completed:
-                continue
-            if t.due_date and t.due_date.date() == today:
-                out.append(t)
-        return out
+                return False
+            return bool(t.due_date) and t.due_date.date() == today
+
+        async def fetch(project: Project) -> list[Task]:
+            cached = self._cached_project_tasks(project.id)
+            if cached is not None:
+                return [t for t in cached if keep(t)]
+            async with self._fan_out_slots:
+                try:
+                    raw_tasks = await self._get_project_task_data(project.id)
+                except HTTPStatusError:
+                    return []
+            from_api = Task.from_api
+            out: list[Task] = []
+            for d in raw_tasks:
+                due = d.get("dueDate")
+                if isinstance(due, str) and due.startswith(prefix):
+                    t = from_api(d)
+                    if keep(t):
+                        out.append(t)
+            return out
+
+        results = await asyncio.gather(*(fetch(p) for p in projects))
+        return list(itertools.chain.from_iterable(results))
 
     async def get_groups(self) -> list[dict]:
         """Best-effort: fetch project groups (folders).
@@ -298,29 +597,31 @@ class TickTickClient:
         The TickTick Open API doesn't clearly document group endpoints. We try a
         likely path and fall back to an empty list.
         """
-        client = await self._get_client()
+        import httpx
+
+        cached = self._groups_cache
+        if cached and time.monotonic() - cached[0] < self.PROJECTS_TTL:
+            return list(cached[1])
+
         try:
-            response = await client.get(
-                f"{self.OPEN_API_URL}/project/group",
-                headers=self._headers,
-            )
+            response = await self._request("GET", "/project/group")
             response.raise_for_status()
-            data = response.json()
-            if isinstance(data, list):
-                return data
-            return []
+            data = _parse_json(response)
+            groups = data if isinstance(data, list) else []
         except httpx.HTTPError:
             return []
+        by_name: dict[str, str] = {}
+        for g in groups:
+            by_name.setdefault(_norm_name(g.get("name", "")), str(g.get("id")))
+        self._groups_cache = (time.monotonic(), groups)
+        self._group_ids_by_name = by_name
+        return list(groups)
 
-    async def filter_tasks_by_folder_name(self, tasks: list[Task], folder_name: str) -> list[Task]:
+    async def filter_tasks_by_folder_name(self, tasks: Iterable[Task], folder_name: str) -> list[Task]:
         """Filter tasks to those whose project belongs to a folder/group name."""
-        folder_name_norm = folder_name.strip().casefold()
-        groups = await self.get_groups()
-        group_id: str | None = None
-        for g in groups:
-            if str(g.get("name", "")).strip().casefold() == folder_name_norm:
-                group_id = str(g.get("id"))
-                break
+        if not await self.get_groups():
+            return []
+        group_id = self._group_ids_by_name.get(_norm_name(folder_name))
         if not group_id:
             return []
 
@@ -334,113 +635,163 @@ class TickTickClient:
         If the Open API doesn't support a tags endpoint, scan tasks and return
         unique tag names.
         """
-        tasks = await self.get_all_tasks()
+        # Tags are collected per project while task payloads are decoded, so
+        # this only needs the (usually cached) task fetch to have happened.
+        projects = await self.get_projects()
+        await self.get_all_tasks()
         tag_set: set[str] = set()
-        for t in tasks:
-            for tag in (t.tags or []):
-                if isinstance(tag, str) and tag.strip():
-                    tag_set.add(tag.strip())
+        for p in projects:
+            tag_set.update(self._project_tags.get(p.id, ()))
         return sorted(tag_set)
     
     # Project endpoints
     async def get_projects(self) -> list[Project]:
-        """Get all projects (lists)."""
-        client = await self._get_client()
-        response = await client.get(
-            f"{self.OPEN_API_URL}/project",
-            headers=self._headers,
-        )
+        """Get all projects (lists).
+
+        Results are cached for `PROJECTS_TTL` seconds; see `invalidate_projects`.
+        """
+        cached = self._projects_cache
+        if cached and time.monotonic() - cached[0] < self.PROJECTS_TTL:
+            return list(cached[1])
+
+        response = await self._request("GET", "/project")
         response.raise_for_status()
-        return [Project.from_api(p) for p in response.json()]
+        projects = [Project.from_api(p) for p in _parse_json(response)]
+        by_name: dict[str, Project] = {}
+        for p in projects:
+            # setdefault keeps the first match, like a linear scan would.
+            by_name.setdefault(_norm_name(p.name), p)
+        self._projects_cache = (time.monotonic(), projects)
+        self._projects_by_name = by_name
+        return list(projects)
     
     async def get_project(self, project_id: str) -> Project:
         """Get a specific project by ID."""
-        client = await self._get_client()
-        response = await client.get(
-            f"{self.OPEN_API_URL}/project/{project_id}",
-            headers=self._headers,
-        )
+        response = await self._request("GET", self._PROJECT_URL % project_id)
         response.raise_for_status()
-        return Project.from_api(response.json())
+        return Project.from_api(_parse_json(response))
     
     # Task endpoints
-    async def get_project_tasks(self, project_id: str) -> list[Task]:
-        """Get all tasks in a project."""
-        client = await self._get_client()
-        response = await client.get(
-            f"{self.OPEN_API_URL}/project/{project_id}/data",
-            headers=self._headers,
-        )
+    async def _get_project_task_data(self, project_id: str) -> list[dict]:
+        """Get a project's raw task dicts, without building Task objects.
+
+        Sends a conditional request when the last response carried an ETag;
+        a 304 reuses the previously decoded payload and its tags.
+        """
+        cached = self._project_etags.get(project_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = await self._request("GET", self._PROJECT_DATA_URL % project_id, headers=headers)
+        if cached and response.status_code == 304:
+            self._project_tags[project_id] = set(cached[2])
+            return cached[1]
         response.raise_for_status()
-        data = response.json()
+        data = _parse_json(response)
         tasks = data.get("tasks", [])
-        return [Task.from_api(t) for t in tasks]
+        tags = {
+            tag.strip()
+            for t in tasks
+            for tag in (t.get("tags") or ())
+            if isinstance(tag, str) and tag.strip()
+        }
+        etag = response.headers.get("ETag")
+        if etag:
+            self._project_etags[project_id] = (etag, tasks, frozenset(tags))
+        else:
+            self._project_etags.pop(project_id, None)
+        self._project_tags[project_id] = tags
+        return tasks
+    
+    async def get_project_tasks(self, project_id: str) -> list[Task]:
+        """Get all tasks in a project.
+
+        The list is cached for `TASKS_TTL` seconds and patched in place by
+        this client's task mutations; callers should not mutate it.
+        """
+        cached = self._cached_project_tasks(project_id)
+        if cached is not None:
+            return cached
+        tasks = await self._get_project_task_data(project_id)
+        from_api = Task.from_api
+        result = [from_api(t) for t in tasks]
+        self._tasks_cache[project_id] = (time.monotonic(), result)
+        return result
     
     async def get_task(self, project_id: str, task_id: str) -> Task:
         """Get a specific task by ID."""
-        client = await self._get_client()
-        response = await client.get(
-            f"{self.OPEN_API_URL}/project/{project_id}/task/{task_id}",
-            headers=self._headers,
-        )
+        response = await self._request("GET", self._TASK_URL % (project_id, task_id))
         response.raise_for_status()
-        return Task.from_api(response.json())
+        return Task.from_api(_parse_json(response))
     
     async def create_task(self, task: Task) -> Task:
         """Create a new task."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.OPEN_API_URL}/task",
-            headers=self._headers,
-            json=task.to_api(),
+        response = await self._request(
+            "POST",
+            "/task",
+            content=orjson.dumps(task.to_api()),
         )
         response.raise_for_status()
-        return Task.from_api(response.json())
+        created = Task.from_api(_parse_json(response))
+        self._cache_task(created)
+        return created
     
     async def update_task(self, task: Task) -> Task:
         """Update an existing task."""
-        client = await self._get_client()
         data = task.to_api()
         data["id"] = task.id
-        response = await client.post(
-            f"{self.OPEN_API_URL}/task/{task.id}",
-            headers=self._headers,
-            json=data,
+        response = await self._request(
+            "POST",
+            self._TASK_UPDATE_URL % task.id,
+            content=orjson.dumps(data),
         )
         response.raise_for_status()
-        return Task.from_api(response.json())
+        updated = Task.from_api(_parse_json(response))
+        self._cache_task(updated)
+        return updated
     
     async def complete_task(self, project_id: str, task_id: str) -> None:
         """Mark a task as complete."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.OPEN_API_URL}/project/{project_id}/task/{task_id}/complete",
-            headers=self._headers,
-        )
+        response = await self._request("POST", self._TASK_COMPLETE_URL % (project_id, task_id))
         response.raise_for_status()
+        found = self._find_cached_task(project_id, task_id)
+        if found:
+            tasks, i = found
+            tasks[i].status = 2
     
     async def delete_task(self, project_id: str, task_id: str) -> None:
         """Delete a task."""
-        client = await self._get_client()
-        response = await client.delete(
-            f"{self.OPEN_API_URL}/project/{project_id}/task/{task_id}",
-            headers=self._headers,
-        )
+        response = await self._request("DELETE", self._TASK_URL % (project_id, task_id))
         response.raise_for_status()
+        found = self._find_cached_task(project_id, task_id)
+        if found:
+            tasks, i = found
+            del tasks[i]
+        self._refresh_project_tags(project_id)
     
     # Helper methods
     async def get_all_tasks(self) -> list[Task]:
-        """Get all tasks from all projects."""
+        """Get all tasks from all projects.
+
+        Per-project task lists are cached for `TASKS_TTL` seconds and kept in
+        step with tasks created, updated, completed or deleted through this
+        client.
+        """
+        from httpx import HTTPStatusError
+
         projects = await self.get_projects()
-        all_tasks = []
-        for project in projects:
-            try:
-                tasks = await self.get_project_tasks(project.id)
-                all_tasks.extend(tasks)
-            except httpx.HTTPStatusError:
-                # Skip projects that fail (might be special projects)
-                continue
-        return all_tasks
+
+        async def fetch(project: Project) -> list[Task]:
+            cached = self._cached_project_tasks(project.id)
+            if cached is not None:
+                return cached
+            async with self._fan_out_slots:
+                try:
+                    return await self.get_project_tasks(project.id)
+                except HTTPStatusError:
+                    # Skip projects that fail (might be special projects)
+                    return []
+
+        results = await asyncio.gather(*(fetch(p) for p in projects))
+        return list(itertools.chain.from_iterable(results))
 
 
 class TokenStorage:
@@ -453,22 +804,48 @@ class TokenStorage:
             path = os.path.join(config_dir, "tokens.json")
         self.path = path
     
-    def save(self, access_token: str, refresh_token: Optional[str] = None) -> None:
-        """Save tokens to file."""
+    def save(
+        self,
+        access_token: str,
+        refresh_token: Optional[str] = None,
+        expiry: Optional[datetime] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+    ) -> None:
+        """Save tokens to file.
+
+        The access token's expiry and the client credentials are saved too,
+        if known, so a restored session can refresh the token.
+        """
         data = {"access_token": access_token}
         if refresh_token:
             data["refresh_token"] = refresh_token
-        with open(self.path, "w") as f:
-            json.dump(data, f)
-        # Restrict permissions
-        os.chmod(self.path, 0o600)
+        if expiry:
+            data["expiry"] = expiry.isoformat()
+        if client_id:
+            data["client_id"] = client_id
+        if client_secret:
+            data["client_secret"] = client_secret
+        # Create the temp file owner-only, then atomically swap it in so a
+        # crash never leaves a truncated tokens file behind.
+        tmp_path = self.path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_path, self.path)
     
     def load(self) -> dict:
-        """Load tokens from file."""
+        """Load tokens from file.
+
+        A stored ``expiry`` is returned as a timezone-aware datetime.
+        """
         if not os.path.exists(self.path):
             return {}
-        with open(self.path, "r") as f:
-            return json.load(f)
+        with open(self.path, "rb") as f:
+            data = orjson.loads(f.read())
+        if "expiry" in data:
+            data["expiry"] = _parse_date(data["expiry"])
+        return data
     
     def clear(self) -> None:
         """Clear stored tokens."""
@@ -18,11 +18,29 @@ from textual.screen import Screen, ModalScreen
 from textual import on
 
 from .api import TickTickClient, TickTickAuth, Task, Project, TokenStorage
-from .oauth import perform_oauth_flow
 
 import asyncio
+import bisect
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
+from typing import Any, Coroutine
+
+
+# Markup for the status rows shown in place of list content.
+_LOADING_MARKUP = "[dim]Loading...[/]"
+_NO_TASKS_MARKUP = "[dim]No tasks[/]"
+
+
+class MessageItem(ListItem):
+    """A list row showing a status message (loading, empty, error) instead of data."""
+    
+    def __init__(self, markup: str) -> None:
+        super().__init__()
+        self.markup = markup
+    
+    def compose(self) -> ComposeResult:
+        yield Label(self.markup, markup=True)
 
 
 class ProjectItem(ListItem):
@@ -48,6 +66,11 @@ class SidebarSection:
     title: str
     project: Project | None = None
 
+    @property
+    def key(self) -> str:
+        """Identity that survives a reload (Project objects are rebuilt)."""
+        return self.project.id if self.project else self.kind
+
 
 class SidebarSectionItem(ListItem):
     """A list item representing a sidebar section (Today/Tomorrow/Inbox/Project)."""
@@ -82,23 +105,54 @@ def _as_local_date(dt) -> date | None:
         return None
 
 
+# Priority indicator markup, keyed by TickTick priority (0/1/3/5).
+_PRIORITY_MARKUP = {
+    0: "[dim] [/]",
+    1: "[blue]![/]",
+    3: "[yellow]!![/]",
+    5: "[red]!!![/]",
+}
+
+
+def _task_sort_key(task: Task) -> tuple[bool, int]:
+    """Sort key for task lists: incomplete first, then by priority (high to low)."""
+    return task.status == 2, -task.priority
+
+
+def _row_key(task: Task) -> object:
+    """Key matching a task to its row across renders.
+
+    Optimistic stubs have no id yet, so they are keyed by identity instead
+    of all sharing the empty id.
+    """
+    return task.id or id(task)
+
+
+def _task_markup(task: Task) -> str:
+    status_char = "✓" if task.is_completed else "○"
+    return f"{_PRIORITY_MARKUP.get(task.priority, '[dim] [/]')} {status_char} {task.title}"
+
+
 class TaskItem(ListItem):
     """A list item representing a task."""
     
     def __init__(self, task_data: Task) -> None:
         super().__init__()
         self.task_data = task_data
+        self._markup = _task_markup(task_data)
     
     def compose(self) -> ComposeResult:
-        # Priority indicator
-        priority_colors = {0: "dim", 1: "blue", 3: "yellow", 5: "red"}
-        priority_char = {0: " ", 1: "!", 3: "!!", 5: "!!!"}
-        
-        status_char = "✓" if self.task_data.is_completed else "○"
-        priority = priority_char.get(self.task_data.priority, " ")
-        
-        text = f"[{priority_colors.get(self.task_data.priority, 'dim')}]{priority}[/] {status_char} {self.task_data.title}"
-        yield Label(text, classes="task-label", markup=True)
+        self._label = Label(self._markup, classes="task-label", markup=True)
+        yield self._label
+    
+    def update_from(self, task: Task) -> None:
+        """Show `task` in this row, touching the label only if its text changed."""
+        self.task_data = task
+        markup = _task_markup(task)
+        if markup != self._markup:
+            self._markup = markup
+            if self.is_mounted:
+                self._label.update(markup)
 
 
 class TaskDetail(Static):
@@ -107,46 +161,44 @@ class TaskDetail(Static):
     def __init__(self, current_task: Task | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self._current_task = current_task
+        # Markup currently shown, so re-selecting an unchanged task is a no-op.
+        self._rendered = self._render_content()
     
     def compose(self) -> ComposeResult:
-        yield Static(self._render_content(), id="task-detail-content")
+        self._content = Static(self._rendered, id="task-detail-content")
+        yield self._content
     
     def _render_content(self) -> str:
-        if not self._current_task:
+        task = self._current_task
+        if not task:
             return "[dim]No task selected[/]"
         
-        lines = []
-        lines.append(f"[bold]{self._current_task.title}[/bold]")
-        lines.append("")
-        lines.append(f"[cyan]Priority:[/] {self._current_task.priority_label}")
-        lines.append(f"[cyan]Status:[/] {'Completed' if self._current_task.is_completed else 'Active'}")
-        
-        if self._current_task.due_date:
-            lines.append(f"[cyan]Due:[/] {self._current_task.due_date.strftime('%Y-%m-%d %H:%M')}")
-        
-        if self._current_task.content:
-            lines.append("")
-            lines.append("[cyan]Description:[/]")
-            lines.append(self._current_task.content)
-        
-        if self._current_task.tags:
-            lines.append("")
-            lines.append(f"[cyan]Tags:[/] {', '.join(self._current_task.tags)}")
-        
-        if self._current_task.items:
-            lines.append("")
-            lines.append("[cyan]Checklist:[/]")
-            for item in self._current_task.items:
-                status = "✓" if item.get("status", 0) == 1 else "○"
-                lines.append(f"  {status} {item.get('title', '')}")
+        status = "Completed" if task.is_completed else "Active"
+        due = f"\n[cyan]Due:[/] {task.due_date:%Y-%m-%d %H:%M}" if task.due_date else ""
+        description = f"\n\n[cyan]Description:[/]\n{task.content}" if task.content else ""
+        tags = f"\n\n[cyan]Tags:[/] {', '.join(task.tags)}" if task.tags else ""
+        checklist = ""
+        if task.items:
+            checklist = "\n\n[cyan]Checklist:[/]" + "".join(
+                f"\n  {'✓' if item.get('status', 0) == 1 else '○'} {item.get('title', '')}"
+                for item in task.items
+            )
         
-        return "\n".join(lines)
+        return (
+            f"[bold]{task.title}[/bold]\n\n"
+            f"[cyan]Priority:[/] {task.priority_label}\n"
+            f"[cyan]Status:[/] {status}"
+            f"{due}{description}{tags}{checklist}"
+        )
     
     def update_task(self, task: Task) -> None:
         """Update the displayed task."""
         self._current_task = task
-        content = self.query_one("#task-detail-content", Static)
-        content.update(self._render_content())
+        rendered = self._render_content()
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
+        self._content.update(rendered)
 
 
 class HelpPanel(Static):
@@ -168,184 +220,153 @@ class HelpPanel(Static):
         yield Static(help_text, classes="help-content", markup=True)
 
 
-class NewTaskModal(ModalScreen):
-    """Modal for creating a new task."""
-    
-    CSS = """
-    NewTaskModal {
+class DialogScreen(ModalScreen):
+    """Base for the centred dialog modals: a card with a right-aligned button row."""
+    
+    # A screen's CSS is scoped to its concrete class, whereas DEFAULT_CSS is
+    # collected along the MRO, so every dialog shares these rules and only
+    # adds its own width, border colour and widget tweaks.
+    DEFAULT_CSS = """
+    DialogScreen {
         align: center middle;
     }
     
-    NewTaskModal > Vertical {
-        width: 60;
+    DialogScreen > Vertical {
         height: auto;
         background: $surface;
         border: thick $primary;
         padding: 1 2;
     }
     
-    NewTaskModal Input {
-        width: 100%;
-        margin-bottom: 1;
-    }
-    
-    NewTaskModal TextArea {
-        height: 5;
-        margin-bottom: 1;
-    }
-    
-    NewTaskModal Horizontal {
+    DialogScreen Horizontal {
         width: 100%;
         height: auto;
         align: right middle;
     }
     
-    NewTaskModal Button {
+    DialogScreen Button {
         margin-left: 1;
     }
     """
-    
-    BINDINGS = [
-        Binding("escape", "cancel", "Cancel"),
-    ]
-    
-    def __init__(self, project_id: str) -> None:
-        super().__init__()
-        self.project_id = project_id
-    
-    def compose(self) -> ComposeResult:
-        with Vertical():
-            yield Label("[bold]New Task[/bold]", markup=True)
-            yield Input(placeholder="Task title", id="task-title")
-            yield TextArea(id="task-content")
-            with Horizontal():
-                yield Button("Cancel", variant="default", id="cancel")
-                yield Button("Create", variant="primary", id="create")
-    
-    def action_cancel(self) -> None:
-        self.dismiss(None)
-    
-    @on(Button.Pressed, "#cancel")
-    def on_cancel(self) -> None:
-        self.dismiss(None)
-    
-    @on(Button.Pressed, "#create")
-    def on_create(self) -> None:
-        title = self.query_one("#task-title", Input).value
-        content = self.query_one("#task-content", TextArea).text
-        
-        if title.strip():
-            task = Task(
-                id="",
-                title=title.strip(),
-                project_id=self.project_id,
-                content=content.strip(),
-            )
-            self.dismiss(task)
-        else:
-            self.notify("Task title is required", severity="error")
 
 
-class EditTaskModal(ModalScreen):
-    """Modal for editing an existing task."""
-    
-    CSS = """
-    EditTaskModal {
-        align: center middle;
-    }
+class TaskFormModal(DialogScreen):
+    """Base for the new/edit task modals: a title input and a content area.
+
+    Subclasses set the heading and submit button, and may override the
+    initial field values and how the entered title/content become the
+    dismissed `Task` (by default, a new unsaved task in `project_id`).
+    """
     
-    EditTaskModal > Vertical {
+    DEFAULT_CSS = """
+    TaskFormModal > Vertical {
         width: 60;
-        height: auto;
-        background: $surface;
-        border: thick $primary;
-        padding: 1 2;
     }
     
-    EditTaskModal Input {
+    TaskFormModal Input {
         width: 100%;
         margin-bottom: 1;
     }
     
-    EditTaskModal TextArea {
+    TaskFormModal TextArea {
         height: 5;
         margin-bottom: 1;
     }
-    
-    EditTaskModal Horizontal {
-        width: 100%;
-        height: auto;
-        align: right middle;
-    }
-    
-    EditTaskModal Button {
-        margin-left: 1;
-    }
     """
     
     BINDINGS = [
         Binding("escape", "cancel", "Cancel"),
     ]
     
-    def __init__(self, task: Task) -> None:
+    HEADING = ""
+    SUBMIT_LABEL = ""
+    SUBMIT_ID = ""
+    
+    def __init__(self, project_id: str) -> None:
         super().__init__()
-        self.task = task
+        self.project_id = project_id
+    
+    def _initial_values(self) -> tuple[str, str]:
+        """Return the initial (title, content) shown in the form."""
+        return "", ""
+    
+    def _build_result(self, title: str, content: str) -> Task:
+        """Return the task to dismiss with for the entered title/content."""
+        return Task(id="", title=title, project_id=self.project_id, content=content)
     
     def compose(self) -> ComposeResult:
+        title, content = self._initial_values()
         with Vertical():
-            yield Label("[bold]Edit Task[/bold]", markup=True)
-            yield Input(value=self.task.title, placeholder="Task title", id="task-title")
-            yield TextArea(self.task.content or "", id="task-content")
+            yield Label(f"[bold]{self.HEADING}[/bold]", markup=True)
+            self._title_input = Input(value=title, placeholder="Task title", id="task-title")
+            self._content_area = TextArea(content, id="task-content")
+            yield self._title_input
+            yield self._content_area
             with Horizontal():
                 yield Button("Cancel", variant="default", id="cancel")
-                yield Button("Save", variant="primary", id="save")
+                yield Button(self.SUBMIT_LABEL, variant="primary", id=self.SUBMIT_ID)
     
     def action_cancel(self) -> None:
         self.dismiss(None)
     
-    @on(Button.Pressed, "#cancel")
-    def on_cancel(self) -> None:
-        self.dismiss(None)
+    @on(Button.Pressed)
+    def on_button(self, event: Button.Pressed) -> None:
+        if event.button.id == "cancel":
+            self.action_cancel()
+        else:
+            self._submit()
     
-    @on(Button.Pressed, "#save")
-    def on_save(self) -> None:
-        title = self.query_one("#task-title", Input).value
-        content = self.query_one("#task-content", TextArea).text
+    def _submit(self) -> None:
+        title = self._title_input.value
+        content = self._content_area.text
         
         if title.strip():
-            self.task.title = title.strip()
-            self.task.content = content.strip()
-            self.dismiss(self.task)
+            self.dismiss(self._build_result(title.strip(), content.strip()))
         else:
             self.notify("Task title is required", severity="error")
 
 
-class ConfirmModal(ModalScreen):
+class NewTaskModal(TaskFormModal):
+    """Modal for creating a new task."""
+    
+    HEADING = "New Task"
+    SUBMIT_LABEL = "Create"
+    SUBMIT_ID = "create"
+
+
+class EditTaskModal(TaskFormModal):
+    """Modal for editing an existing task."""
+    
+    HEADING = "Edit Task"
+    SUBMIT_LABEL = "Save"
+    SUBMIT_ID = "save"
+    
+    def __init__(self, task: Task) -> None:
+        super().__init__(task.project_id)
+        # Not `self.task`: Screen already defines a read-only `task` property.
+        self.edited_task = task
+    
+    def _initial_values(self) -> tuple[str, str]:
+        return self.edited_task.title, self.edited_task.content or ""
+    
+    def _build_result(self, title: str, content: str) -> Task:
+        self.edited_task.title = title
+        self.edited_task.content = content
+        return self.edited_task
+
+
+class ConfirmModal(DialogScreen):
     """Modal for confirming actions."""
     
     CSS = """
-    ConfirmModal {
-        align: center middle;
-    }
-    
     ConfirmModal > Vertical {
         width: 50;
-        height: auto;
-        background: $surface;
         border: thick $error;
-        padding: 1 2;
     }
     
     ConfirmModal Horizontal {
-        width: 100%;
-        height: auto;
-        align: right middle;
         margin-top: 1;
     }
-    
-    ConfirmModal Button {
-        margin-left: 1;
-    }
     """
     
     BINDINGS = [
@@ -371,13 +392,9 @@ class ConfirmModal(ModalScreen):
     def action_confirm(self) -> None:
         self.dismiss(True)
     
-    @on(Button.Pressed, "#no")
-    def on_no(self) -> None:
-        self.dismiss(False)
-    
-    @on(Button.Pressed, "#yes")
-    def on_yes(self) -> None:
-        self.dismiss(True)
+    @on(Button.Pressed)
+    def on_button(self, event: Button.Pressed) -> None:
+        self.dismiss(event.button.id == "yes")
 
 
 class LoginScreen(Screen):
@@ -459,7 +476,9 @@ class LoginScreen(Screen):
         status_label = self.query_one("#status-label", Label)
         status_label.update("[yellow]Starting OAuth flow... Check your browser![/]")
         try:
-            access_token, refresh_token, error = await perform_oauth_flow(
+            # Deferred: only needed here, and it pulls in http.server/webbrowser.
+            from .oauth import perform_oauth_flow
+            access_token, refresh_token, expiry, error = await perform_oauth_flow(
                 client_id,
                 client_secret,
             )
@@ -469,7 +488,7 @@ class LoginScreen(Screen):
                 return
             if access_token:
                 status_label.update("[green]Authorization successful![/]")
-                self.app.setup_client(client_id, client_secret, access_token, refresh_token)
+                self.app.setup_client(client_id, client_secret, access_token, refresh_token, expiry)
                 self.app.switch_screen("main")
             else:
                 status_label.update("[red]No access token received[/]")
@@ -593,48 +612,60 @@ class MainScreen(Screen):
         Binding("question_mark", "show_help", "Help", show=True),
     ]
     
+    # Seconds the sidebar highlight must rest before its tasks are fetched.
+    HIGHLIGHT_LOAD_DELAY = 0.2
+    # Loads faster than this never show the "Loading..." placeholder.
+    LOADING_PLACEHOLDER_DELAY = 0.15
+    
     def __init__(self) -> None:
         super().__init__()
+        self._pending_load: asyncio.Task | None = None
         self.projects: list[Project] = []
         self.tasks: list[Task] = []
         self.current_project: Project | None = None
         self.current_task: Task | None = None
         self.current_section: SidebarSection | None = None
-        self._panel_order = ["projects-list", "tasks-list"]
+        # What the tasks list currently shows (project id or section kind),
+        # so reloading the same view can diff rows instead of rebuilding.
+        self._tasks_view: str | None = None
         self._current_panel_idx = 0
     
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         
-        with Vertical(id="projects-panel", classes="panel"):
+        # Keep references to the widgets the handlers touch, so they don't
+        # re-query the DOM on every keypress.
+        self._projects_list = ListView(id="projects-list")
+        self._tasks_list = ListView(id="tasks-list")
+        self._detail = TaskDetail(id="task-detail")
+        
+        with Vertical(id="projects-panel", classes="panel") as self._projects_panel:
             yield Static("Projects", classes="panel-title")
-            yield ListView(id="projects-list")
+            yield self._projects_list
         
-        with Vertical(id="tasks-panel", classes="panel"):
+        with Vertical(id="tasks-panel", classes="panel") as self._tasks_panel:
             yield Static("Tasks", classes="panel-title")
-            yield ListView(id="tasks-list")
+            yield self._tasks_list
         
         with Vertical(id="detail-panel", classes="panel"):
             yield Static("Details", classes="panel-title")
-            yield TaskDetail(id="task-detail")
+            yield self._detail
         
         yield Footer()
     
     async def on_mount(self) -> None:
         """Load data when screen is mounted."""
-        self.query_one("#projects-panel").add_class("focused")
+        self._projects_panel.add_class("focused")
         await self.load_projects()
-        self.query_one("#projects-list", ListView).focus()
+        self._projects_list.focus()
     
     async def load_projects(self) -> None:
         """Load projects from the API and populate the sidebar sections."""
-        projects_list = self.query_one("#projects-list", ListView)
-        projects_list.clear()
-        projects_list.append(ListItem(Label("[dim]Loading...[/]", markup=True)))
+        projects_list = self._projects_list
         
         try:
-            self.projects = await self.app.client.get_projects()
-            projects_list.clear()
+            async with self._loading_placeholder(projects_list):
+                self.projects = await self.app.client.get_projects()
 
             # Top sections
             sections: list[SidebarSection] = [
@@ -649,19 +680,40 @@ class MainScreen(Screen):
                     SidebarSection(kind="project", title=project.name, project=project)
                 )
 
+            # Keep the previously selected section if it still exists,
+            # otherwise select the first one (Today).
+            prev_key = self.current_section.key if self.current_section else None
+            index = next((i for i, s in enumerate(sections) if s.key == prev_key), 0)
+            selected = sections[index]
+            # Start fetching its tasks now so the request overlaps mounting
+            # the sidebar; the load below then reads the warmed cache.
+            prefetch = asyncio.create_task(self._prefetch_section_tasks(selected))
+
+            projects_list.clear()
             for section in sections:
                 projects_list.append(SidebarSectionItem(section))
+            projects_list.index = index
+            self.current_section = selected
 
-            # Select first section (Today)
-            if sections:
-                projects_list.index = 0
-                self.current_section = sections[0]
-                await self.load_tasks_for_section(self.current_section)
+            await prefetch
+            await self.load_tasks_for_section(selected)
         except Exception as e:
-            projects_list.clear()
-            projects_list.append(ListItem(Label(f"[red]Error: {e}[/]", markup=True)))
+            await self._show_message(projects_list, f"[red]Error: {e}[/]")
             self.notify(f"Failed to load projects: {e}", severity="error")
 
+    async def _prefetch_section_tasks(self, section: SidebarSection) -> None:
+        """Warm the client's task cache for `section`.
+
+        Errors are ignored here; the real load retries and reports them.
+        """
+        try:
+            if section.project is not None:
+                await self.app.client.get_project_tasks(section.project.id)
+            else:
+                await self.app.client.get_all_tasks()
+        except Exception:
+            pass
+
     async def load_tasks_for_section(self, section: SidebarSection) -> None:
         """Load tasks based on the selected sidebar section."""
 
@@ -696,17 +748,19 @@ class MainScreen(Screen):
     async def load_special_tasks(self, kind: str) -> None:
         """Load tasks for logical sections like Today/Tomorrow/Inbox."""
 
-        tasks_list = self.query_one("#tasks-list", ListView)
-        tasks_list.clear()
-        tasks_list.append(ListItem(Label("[dim]Loading...[/]", markup=True)))
+        tasks_list = self._tasks_list
+        switching = self._tasks_view != kind
+        if switching:
+            self._tasks_view = None
 
         try:
-            all_tasks = await self.app.client.get_all_tasks()
+            async with self._loading_placeholder(tasks_list, show=switching):
+                all_tasks = await self.app.client.get_all_tasks()
+                inbox = await self.app.client.resolve_inbox_project() if kind == "inbox" else None
             # Filter incomplete by default
             relevant = [t for t in all_tasks if not t.is_completed]
 
-            if kind == "inbox":
-                inbox = await self.app.client.resolve_inbox_project()
+            if inbox is not None:
                 relevant = [t for t in relevant if t.project_id == inbox.id]
             elif kind in {"today", "tomorrow"}:
                 today = date.today()
@@ -716,72 +770,190 @@ class MainScreen(Screen):
                 relevant = []
 
             self.tasks = relevant
-            tasks_list.clear()
 
             # Sort tasks: incomplete first, then by priority (high to low)
-            self.tasks.sort(key=lambda t: (t.is_completed, -t.priority))
-
-            for task in self.tasks:
-                tasks_list.append(TaskItem(task))
+            self.tasks.sort(key=_task_sort_key)
 
-            if not self.tasks:
-                tasks_list.append(ListItem(Label("[dim]No tasks[/]", markup=True)))
-                self.current_task = None
-                self.update_task_detail()
-            else:
-                tasks_list.index = 0
-                self.current_task = self.tasks[0]
-                self.update_task_detail()
+            await self._show_task_list(keep_selection=not switching)
+            self._tasks_view = kind
         except Exception as e:
-            tasks_list.clear()
-            tasks_list.append(ListItem(Label(f"[red]Error: {e}[/]", markup=True)))
+            self._tasks_view = None
+            await self._show_message(tasks_list, f"[red]Error: {e}[/]")
             self.notify(f"Failed to load tasks: {e}", severity="error")
     
     async def load_tasks(self, project_id: str) -> None:
         """Load tasks for a project."""
-        tasks_list = self.query_one("#tasks-list", ListView)
-        tasks_list.clear()
-        tasks_list.append(ListItem(Label("[dim]Loading...[/]", markup=True)))
+        tasks_list = self._tasks_list
+        switching = self._tasks_view != project_id
+        if switching:
+            self._tasks_view = None
         
         try:
-            self.tasks = await self.app.client.get_project_tasks(project_id)
-            tasks_list.clear()
-            
-            # Sort tasks: incomplete first, then by priority (high to low)
-            self.tasks.sort(key=lambda t: (t.is_completed, -t.priority))
+            async with self._loading_placeholder(tasks_list, show=switching):
+                tasks = await self.app.client.get_project_tasks(project_id)
             
-            for task in self.tasks:
-                tasks_list.append(TaskItem(task))
+            # Sort tasks: incomplete first, then by priority (high to low).
+            # sorted() copies, leaving the client's cached list untouched.
+            self.tasks = sorted(tasks, key=_task_sort_key)
             
-            if not self.tasks:
-                tasks_list.append(ListItem(Label("[dim]No tasks[/]", markup=True)))
-            else:
-                tasks_list.index = 0
-                self.current_task = self.tasks[0]
-                self.update_task_detail()
+            await self._show_task_list(keep_selection=not switching)
+            self._tasks_view = project_id
         except Exception as e:
-            tasks_list.clear()
-            tasks_list.append(ListItem(Label(f"[red]Error: {e}[/]", markup=True)))
+            self._tasks_view = None
+            await self._show_message(tasks_list, f"[red]Error: {e}[/]")
             self.notify(f"Failed to load tasks: {e}", severity="error")
     
+    @asynccontextmanager
+    async def _loading_placeholder(self, list_view: ListView, show: bool = True):
+        """Replace the list with "Loading..." if the wrapped load is slow.
+
+        The placeholder only appears once the body has run for
+        LOADING_PLACEHOLDER_DELAY, so cached and fast loads never pay for the
+        extra clear/mount/layout round.
+        """
+        if not show:
+            yield
+            return
+        
+        loaded = asyncio.Event()
+        
+        async def placeholder() -> None:
+            try:
+                await asyncio.wait_for(loaded.wait(), self.LOADING_PLACEHOLDER_DELAY)
+            except TimeoutError:
+                await self._show_message(list_view, _LOADING_MARKUP)
+        
+        pending = asyncio.create_task(placeholder())
+        try:
+            yield
+        finally:
+            loaded.set()
+            # Returns at once if the placeholder never showed; otherwise lets
+            # its mount finish before the caller replaces it.
+            await pending
+    
+    async def _show_message(self, list_view: ListView, markup: str) -> None:
+        """Replace the list's content with one status row.
+
+        If that exact row is already the only one shown (say, moving between
+        two empty projects), it is kept instead of being remounted.
+        """
+        children = list_view.children
+        if len(children) == 1 and isinstance(children[0], MessageItem) and children[0].markup == markup:
+            return
+        await list_view.clear()
+        await list_view.append(MessageItem(markup))
+    
+    async def _show_task_list(self, keep_selection: bool = False) -> None:
+        """Show freshly loaded `self.tasks` with the first one selected.
+
+        With `keep_selection` (reloading the view already on screen), the
+        selected task stays selected if it is still listed.
+        """
+        if self.tasks:
+            await self._show_tasks(self._tasks_list, self.tasks)
+            index = 0
+            selected = self.current_task
+            if keep_selection and selected is not None and selected.id:
+                index = next((i for i, t in enumerate(self.tasks) if t.id == selected.id), 0)
+            self.current_task = self.tasks[index]
+            self._select_task_row(index)
+        else:
+            await self._show_message(self._tasks_list, _NO_TASKS_MARKUP)
+            self.current_task = None
+        self.update_task_detail()
+    
+    async def _show_tasks(self, tasks_list: ListView, tasks: list[Task]) -> None:
+        """Make the list show exactly `tasks`, in order, reusing rows by task id.
+
+        Rows for tasks that are still present are updated (and moved, if
+        their position changed) in place, and only the added/removed tasks
+        are mounted/unmounted, so reloading a view after a single change
+        doesn't rebuild every row.
+
+        Inserting and moving rows doesn't touch the list's index or row
+        highlights; callers re-apply the selection with `_select_task_row`.
+        """
+        wanted = {_row_key(t) for t in tasks}
+        stale = [
+            i for i, item in enumerate(tasks_list.children)
+            if not isinstance(item, TaskItem) or _row_key(item.task_data) not in wanted
+        ]
+        if stale:
+            await tasks_list.remove_items(stale)
+        
+        existing = {_row_key(item.task_data): item for item in tasks_list.children}
+        if not existing:
+            await tasks_list.extend(TaskItem(task) for task in tasks)
+            return
+        
+        # Rows before `index` are final, so a surviving row is always at or
+        # after its target slot.
+        for index, task in enumerate(tasks):
+            item = existing.get(_row_key(task))
+            if item is None:
+                if index < len(tasks_list.children):
+                    await tasks_list.insert(index, [TaskItem(task)])
+                else:
+                    await tasks_list.append(TaskItem(task))
+                continue
+            item.update_from(task)
+            if tasks_list.children[index] is not item:
+                tasks_list.move_child(item, before=index)
+    
+    def _select_task_row(self, index: int | None) -> None:
+        """Highlight the task row at `index`, and only that row.
+
+        After rows were inserted, moved or removed, ListView.index and the
+        rows' highlight no longer line up, and assigning an unchanged index
+        doesn't re-run its watcher. So every highlight is cleared and the
+        index reset before the new one is set.
+        """
+        tasks_list = self._tasks_list
+        for item in tasks_list.children:
+            if isinstance(item, ListItem):
+                item.highlighted = False
+        tasks_list.index = None
+        tasks_list.index = index
+    
     def update_task_detail(self) -> None:
         """Update the task detail panel."""
-        detail = self.query_one("#task-detail", TaskDetail)
-        detail.update_task(self.current_task)
+        self._detail.update_task(self.current_task)
+    
+    def _cancel_pending_load(self) -> None:
+        """Cancel a scheduled (or in-flight) highlight-triggered load."""
+        if self._pending_load and not self._pending_load.done():
+            self._pending_load.cancel()
+        self._pending_load = None
+    
+    async def _debounced_load(self, section: SidebarSection) -> None:
+        await asyncio.sleep(self.HIGHLIGHT_LOAD_DELAY)
+        await self.load_tasks_for_section(section)
     
     @on(ListView.Selected, "#projects-list")
     async def on_project_selected(self, event: ListView.Selected) -> None:
         """Handle sidebar section selection."""
         if isinstance(event.item, SidebarSectionItem):
+            # Enter loads right away instead of waiting out the debounce.
+            self._cancel_pending_load()
             self.current_section = event.item.section
             await self.load_tasks_for_section(self.current_section)
     
     @on(ListView.Highlighted, "#projects-list")
-    async def on_project_highlighted(self, event: ListView.Highlighted) -> None:
-        """Handle sidebar highlight change."""
+    def on_project_highlighted(self, event: ListView.Highlighted) -> None:
+        """Handle sidebar highlight change.
+
+        Loading is debounced so scrolling through the sidebar only fetches
+        tasks for the section the cursor settles on. Highlights of the
+        section that is already current (e.g. load_projects setting the
+        index itself) are ignored, since that section is loaded already.
+        """
         if isinstance(event.item, SidebarSectionItem):
+            if self.current_section and event.item.section.key == self.current_section.key:
+                return
+            self._cancel_pending_load()
             self.current_section = event.item.section
-            await self.load_tasks_for_section(self.current_section)
+            self._pending_load = asyncio.create_task(self._debounced_load(self.current_section))
     
     @on(ListView.Selected, "#tasks-list")
     def on_task_selected(self, event: ListView.Selected) -> None:
@@ -793,7 +965,9 @@ class MainScreen(Screen):
     @on(ListView.Highlighted, "#tasks-list")
     def on_task_highlighted(self, event: ListView.Highlighted) -> None:
         """Handle task highlight change."""
-        if isinstance(event.item, TaskItem):
+        # Loaders set the index and render the detail themselves; the
+        # Highlighted message they trigger arrives later for the same task.
+        if isinstance(event.item, TaskItem) and event.item.task_data is not self.current_task:
             self.current_task = event.item.task_data
             self.update_task_detail()
     
@@ -811,34 +985,76 @@ class MainScreen(Screen):
             focused.action_cursor_up()
     
     def action_focus_projects(self) -> None:
-        self._current_panel_idx = 0
-        self._update_panel_focus()
-        self.query_one("#projects-list", ListView).focus()
+        self._focus_panel(0)
     
     def action_focus_tasks(self) -> None:
-        self._current_panel_idx = 1
-        self._update_panel_focus()
-        self.query_one("#tasks-list", ListView).focus()
+        self._focus_panel(1)
     
     def action_focus_next_panel(self) -> None:
-        self._current_panel_idx = (self._current_panel_idx + 1) % len(self._panel_order)
-        self._update_panel_focus()
-        self.query_one(f"#{self._panel_order[self._current_panel_idx]}", ListView).focus()
+        self._focus_panel(self._current_panel_idx + 1)
     
     def action_focus_prev_panel(self) -> None:
-        self._current_panel_idx = (self._current_panel_idx - 1) % len(self._panel_order)
+        self._focus_panel(self._current_panel_idx - 1)
+    
+    def _focus_panel(self, idx: int) -> None:
+        """Focus the projects (0) or tasks (1) list; other values wrap around."""
+        self._current_panel_idx = idx % 2
         self._update_panel_focus()
-        self.query_one(f"#{self._panel_order[self._current_panel_idx]}", ListView).focus()
+        (self._tasks_list if self._current_panel_idx else self._projects_list).focus()
     
     def _update_panel_focus(self) -> None:
         """Update visual focus indicators on panels."""
-        self.query_one("#projects-panel").remove_class("focused")
-        self.query_one("#tasks-panel").remove_class("focused")
-        
-        if self._current_panel_idx == 0:
-            self.query_one("#projects-panel").add_class("focused")
+        self._projects_panel.set_class(self._current_panel_idx == 0, "focused")
+        self._tasks_panel.set_class(self._current_panel_idx == 1, "focused")
+    
+    def _refresh_task_row(self, task: Task) -> None:
+        """Re-render the row (and detail panel) showing `task` after a local change."""
+        for item in self._tasks_list.children:
+            if isinstance(item, TaskItem) and item.task_data is task:
+                item.update_from(task)
+                break
+        if task is self.current_task:
+            self.update_task_detail()
+    
+    def _task_position(self, task: Task | None) -> int | None:
+        """Index of `task` itself (not an equal copy) in `self.tasks`."""
+        return next((i for i, t in enumerate(self.tasks) if t is task), None)
+    
+    async def _show_local_tasks(self, previous_index: int | None) -> None:
+        """Re-render `self.tasks` after a local (not yet confirmed) change.
+
+        The selected task stays selected wherever it moved to. If it is gone
+        (deleted), the task now at its old position, `previous_index`, is
+        selected instead.
+        """
+        tasks_list = self._tasks_list
+        if self.tasks:
+            await self._show_tasks(tasks_list, self.tasks)
+            index = self._task_position(self.current_task)
+            if index is None:
+                index = min(previous_index or 0, len(self.tasks) - 1)
+            self.current_task = self.tasks[index]
+            self._select_task_row(index)
+        else:
+            await self._show_message(tasks_list, _NO_TASKS_MARKUP)
+            self.current_task = None
+        self.update_task_detail()
+    
+    async def _resort_local_task(self, task: Task) -> None:
+        """Move `task` to its sorted position after a local status change."""
+        if task in self.tasks:
+            previous_index = self._task_position(self.current_task)
+            self.tasks.remove(task)
+            bisect.insort(self.tasks, task, key=_task_sort_key)
+            await self._show_local_tasks(previous_index)
         else:
-            self.query_one("#tasks-panel").add_class("focused")
+            self._refresh_task_row(task)
+    
+    async def _reload_current_view(self) -> None:
+        if self.current_section:
+            await self.load_tasks_for_section(self.current_section)
+        elif self.current_project:
+            await self.load_tasks(self.current_project.id)
     
     async def action_new_task(self) -> None:
         """Open new task modal."""
@@ -848,21 +1064,32 @@ class MainScreen(Screen):
         
         def handle_result(task: Task | None) -> None:
             if task:
-                asyncio.create_task(self._create_task(task))
+                self.app.run_in_background(self._create_task(task))
         
         await self.app.push_screen(NewTaskModal(self.current_project.id), handle_result)
     
     async def _create_task(self, task: Task) -> None:
-        """Create a task via the API."""
+        """Create a task via the API.
+
+        When the task belongs to the list on screen it is shown right away
+        (without an id); the reload after the API call swaps in the real one.
+        """
+        section = self.current_section
+        if (
+            section is not None
+            and section.kind in ("project", "inbox")
+            and self.current_project is not None
+            and self.current_project.id == task.project_id
+        ):
+            previous_index = self._task_position(self.current_task)
+            bisect.insort(self.tasks, task, key=_task_sort_key)
+            await self._show_local_tasks(previous_index)
         try:
             await self.app.client.create_task(task)
             self.notify(f"Created: {task.title}")
-            if self.current_section:
-                await self.load_tasks_for_section(self.current_section)
-            elif self.current_project:
-                await self.load_tasks(self.current_project.id)
         except Exception as e:
             self.notify(f"Failed to create task: {e}", severity="error")
+        await self._reload_current_view()
     
     async def action_edit_task(self) -> None:
         """Open edit task modal."""
@@ -870,23 +1097,30 @@ class MainScreen(Screen):
             self.notify("Select a task first", severity="warning")
             return
         
+        before = (self.current_task.title, self.current_task.content)
+        
         def handle_result(task: Task | None) -> None:
             if task:
-                asyncio.create_task(self._update_task(task))
+                self.app.run_in_background(self._update_task(task, before))
         
         await self.app.push_screen(EditTaskModal(self.current_task), handle_result)
     
-    async def _update_task(self, task: Task) -> None:
-        """Update a task via the API."""
+    async def _update_task(self, task: Task, before: tuple[str, str]) -> None:
+        """Update a task via the API.
+
+        The modal already edited `task` in place, so its row is re-rendered
+        immediately; `before` holds the (title, content) to restore on failure.
+        """
+        self._refresh_task_row(task)
         try:
             await self.app.client.update_task(task)
             self.notify(f"Updated: {task.title}")
-            if self.current_section:
-                await self.load_tasks_for_section(self.current_section)
-            elif self.current_project:
-                await self.load_tasks(self.current_project.id)
         except Exception as e:
+            task.title, task.content = before
+            self._refresh_task_row(task)
             self.notify(f"Failed to update task: {e}", severity="error")
+            return
+        await self._reload_current_view()
     
     async def action_complete_task(self) -> None:
         """Mark current task as complete."""
@@ -894,22 +1128,28 @@ class MainScreen(Screen):
             self.notify("Select a task first", severity="warning")
             return
         
-        if self.current_task.is_completed:
+        task = self.current_task
+        if task.is_completed:
             self.notify("Task already completed", severity="warning")
             return
         
+        # Show it as completed now; _complete_task reverts on failure.
+        previous_status = task.status
+        task.status = 2
+        await self._resort_local_task(task)
+        self.app.run_in_background(self._complete_task(task, previous_status))
+    
+    async def _complete_task(self, task: Task, previous_status: int) -> None:
+        """Complete a task via the API, reverting the local change on failure."""
         try:
-            await self.app.client.complete_task(
-                self.current_task.project_id,
-                self.current_task.id
-            )
-            self.notify(f"Completed: {self.current_task.title}")
-            if self.current_section:
-                await self.load_tasks_for_section(self.current_section)
-            elif self.current_project:
-                await self.load_tasks(self.current_project.id)
+            await self.app.client.complete_task(task.project_id, task.id)
         except Exception as e:
+            task.status = previous_status
+            await self._resort_local_task(task)
             self.notify(f"Failed to complete task: {e}", severity="error")
+            return
+        self.notify(f"Completed: {task.title}")
+        await self._reload_current_view()
     
     async def action_delete_task(self) -> None:
         """Delete current task with confirmation."""
@@ -917,36 +1157,39 @@ class MainScreen(Screen):
             self.notify("Select a task first", severity="warning")
             return
         
+        # Bind the task now: the selection may move before the dialog closes.
+        task = self.current_task
+        
         def handle_confirm(confirmed: bool) -> None:
             if confirmed:
-                asyncio.create_task(self._delete_task())
+                self.app.run_in_background(self._delete_task(task))
         
         await self.app.push_screen(
-            ConfirmModal(f"Delete task '{self.current_task.title}'?"),
+            ConfirmModal(f"Delete task '{task.title}'?"),
             handle_confirm
         )
     
-    async def _delete_task(self) -> None:
-        """Delete the current task via the API."""
+    async def _delete_task(self, task: Task) -> None:
+        """Delete a task via the API.
+
+        The row is removed right away; on failure the reload puts it back.
+        """
+        if task in self.tasks:
+            previous_index = self._task_position(self.current_task)
+            self.tasks.remove(task)
+            await self._show_local_tasks(previous_index)
         try:
-            task = self.current_task
-            if not task:
-                return
             await self.app.client.delete_task(task.project_id, task.id)
             self.notify(f"Deleted: {task.title}")
-            if self.current_section:
-                await self.load_tasks_for_section(self.current_section)
-            elif self.current_project:
-                await self.load_tasks(self.current_project.id)
         except Exception as e:
             self.notify(f"Failed to delete task: {e}", severity="error")
+            await self._reload_current_view()
     
     async def action_refresh(self) -> None:
         """Refresh the current view."""
-        if self.current_section:
-            await self.load_tasks_for_section(self.current_section)
-        elif self.current_project:
-            await self.load_tasks(self.current_project.id)
+        self.app.client.invalidate_projects()
+        self.app.client.invalidate_tasks()
+        # Reloads the sidebar and then the tasks of the selected section.
         await self.load_projects()
         self.notify("Refreshed")
     
@@ -976,6 +1219,17 @@ class TickTUIApp(App):
         self.client: TickTickClient | None = None
         self.auth: TickTickAuth | None = None
         self.token_storage = TokenStorage()
+        # Task mutations started from UI callbacks. Holding a reference keeps
+        # them from being garbage-collected mid-flight, and on_unmount lets
+        # them finish instead of dropping the write.
+        self._pending_writes: set[asyncio.Task] = set()
+    
+    def run_in_background(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """Run `coro` as a tracked task that is awaited before the app exits."""
+        task = asyncio.create_task(coro)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+        return task
     
     async def on_mount(self) -> None:
         """Check for saved tokens and route to appropriate screen."""
@@ -983,22 +1237,48 @@ class TickTUIApp(App):
         
         if tokens.get("access_token"):
             # Try to use saved token
-            self.setup_client("", "", tokens["access_token"])
-            self.push_screen("main")
+            self.setup_client(
+                tokens.get("client_id", ""),
+                tokens.get("client_secret", ""),
+                tokens["access_token"],
+                tokens.get("refresh_token"),
+                tokens.get("expiry"),
+            )
+            if self.auth.token_expired and not self.auth.can_refresh:
+                self.push_screen("login")
+            else:
+                self.push_screen("main")
         else:
             self.push_screen("login")
     
-    def setup_client(self, client_id: str, client_secret: str, access_token: str, refresh_token: str | None = None) -> None:
+    def setup_client(
+        self,
+        client_id: str,
+        client_secret: str,
+        access_token: str,
+        refresh_token: str | None = None,
+        expiry: datetime | None = None,
+    ) -> None:
         """Set up the TickTick client with credentials."""
-        self.auth = TickTickAuth(client_id, client_secret)
+        self.auth = TickTickAuth(client_id, client_secret, on_refresh=self._save_tokens)
         self.auth.access_token = access_token
+        self.auth.refresh_token = refresh_token
+        self.auth.token_expiry = expiry
         self.client = TickTickClient(self.auth)
         
         # Save tokens for next time
-        self.token_storage.save(access_token, refresh_token)
+        self._save_tokens(self.auth)
+    
+    def _save_tokens(self, auth: TickTickAuth) -> None:
+        """Persist the session's current tokens (also called after each refresh)."""
+        self.token_storage.save(
+            auth.access_token, auth.refresh_token, auth.token_expiry, auth.client_id, auth.client_secret
+        )
     
     async def on_unmount(self) -> None:
         """Clean up when app closes."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
         if self.client:
             await self.client.close()
 
@@ -15,17 +15,21 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from dataclasses import dataclass
+import functools
+import inspect
+import sys
+from contextlib import asynccontextmanager
 from datetime import date, datetime, time
-from typing import Optional
+from typing import AsyncIterator, Final, Iterable, Optional
+
+import orjson
 
 from ticktui.api import Task, TickTickAuth, TickTickClient, TokenStorage
 
 
-@dataclass(frozen=True)
-class ExitCode:
-    OK: int = 0
-    ERROR: int = 1
+# Process exit statuses
+EXIT_OK: Final[int] = 0
+EXIT_ERROR: Final[int] = 1
 
 
 def _parse_date_or_datetime(value: str) -> datetime:
@@ -40,15 +44,14 @@ def _parse_date_or_datetime(value: str) -> datetime:
 
     value = value.strip()
 
-    # Date-only
-    try:
-        d = date.fromisoformat(value)
-    except ValueError:
-        d = None
-
-    if d is not None:
-        # Use midnight local time (naive) — TickTick accepts ISO strings.
-        return datetime.combine(d, time.min)
+    # Date-only: dispatch on the YYYY-MM-DD shape rather than on a failed
+    # date.fromisoformat, so datetimes don't raise and catch a ValueError.
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            # Use midnight local time (naive) — TickTick accepts ISO strings.
+            return datetime.combine(date.fromisoformat(value), time.min)
+        except ValueError:
+            pass
 
     # Datetime
     try:
@@ -62,232 +65,302 @@ def _parse_date_or_datetime(value: str) -> datetime:
     return dt
 
 
-async def _build_client_from_tokens() -> TickTickClient:
+def _write_lines(lines: Iterable[str]) -> None:
+    """Write output lines to stdout in one call rather than one print per line."""
+    lines = list(lines)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _write_json(value: object) -> None:
+    """Write `value` as one line of JSON.
+
+    orjson serializes the Task/Project dataclasses and their datetimes
+    natively, skipping the underscore-prefixed internal fields.
+    """
+    sys.stdout.buffer.write(orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE))
+
+
+# Row prefixes for completed and open tasks
+_DONE_PREFIX = "[x] "
+_OPEN_PREFIX = "[ ] "
+
+
+def _print_tasks(tasks: Iterable[Task], as_json: bool = False) -> None:
+    if as_json:
+        _write_json(list(tasks))
+        return
+    _write_lines(
+        f"{_DONE_PREFIX if t.is_completed else _OPEN_PREFIX}{t.id}  {t.title}  "
+        f"{t.due_date.isoformat() if t.due_date else ''}"
+        for t in tasks
+    )
+
+
+# Shared by every command in the process; closed once by cli_session().
+_CLIENT: Optional[TickTickClient] = None
+# Saved tokens, read once per process. A token refresh rewrites the file,
+# and _save_tokens then updates this copy to match.
+_TOKENS: Optional[dict] = None
+
+
+def _load_tokens() -> dict:
+    global _TOKENS
+    if _TOKENS is None:
+        _TOKENS = TokenStorage().load()
+    return _TOKENS
+
+
+def _save_tokens(auth: TickTickAuth) -> None:
+    """Persist refreshed tokens, keeping the in-process copy in step."""
+    global _TOKENS
     storage = TokenStorage()
-    tokens = storage.load()
+    storage.save(
+        auth.access_token, auth.refresh_token, auth.token_expiry, auth.client_id, auth.client_secret
+    )
+    _TOKENS = storage.load()
+
+
+async def _build_client_from_tokens() -> TickTickClient:
+    global _CLIENT
+    if _CLIENT is not None:
+        return _CLIENT
+
+    tokens = _load_tokens()
     access_token = tokens.get("access_token")
     if not access_token:
         raise RuntimeError(
             "Not logged in. Run the TUI once to authenticate, or store an access_token in ~/.config/ticktui/tokens.json"
         )
 
-    # For the Open API calls we only need an access token.
-    auth = TickTickAuth(client_id="", client_secret="")
+    # The saved client credentials let an expiring token be refreshed.
+    auth = TickTickAuth(
+        client_id=tokens.get("client_id", ""),
+        client_secret=tokens.get("client_secret", ""),
+        on_refresh=_save_tokens,
+    )
     auth.access_token = access_token
-    return TickTickClient(auth)
+    auth.refresh_token = tokens.get("refresh_token")
+    auth.token_expiry = tokens.get("expiry")
+    if auth.token_expired and not auth.can_refresh:
+        raise RuntimeError("Saved access token has expired. Run the TUI to log in again.")
+    _CLIENT = TickTickClient(auth)
+    return _CLIENT
+
+
+@asynccontextmanager
+async def cli_session() -> AsyncIterator[None]:
+    """Run commands against one shared client, closing it when the block exits.
+
+    Commands awaited inside the block reuse the same connection pool (and
+    the client's caches) instead of each opening and closing their own.
+    """
+    global _CLIENT
+    try:
+        yield
+    finally:
+        client, _CLIENT = _CLIENT, None
+        if client is not None:
+            await client.close()
 
 
 async def cmd_tasks_list(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
+    folder = args.folder
+    if args.list_name:
+        # Only the named project's tasks are needed, not every project's.
+        project = await client.resolve_project_by_name(args.list_name)
+        tasks = await client.get_project_tasks(project.id)
+    elif folder:
+        # The group lookup is independent of the task fetch; run them together.
+        tasks, _ = await asyncio.gather(client.get_all_tasks(), client.get_groups())
+    else:
         tasks = await client.get_all_tasks()
 
-        if not args.show_completed:
-            tasks = [t for t in tasks if not t.is_completed]
-
-        if args.list_name:
-            project = await client.resolve_project_by_name(args.list_name)
-            tasks = [t for t in tasks if t.project_id == project.id]
+    # Filters stay lazy and are consumed once, by the folder filter or the output.
+    show_completed = args.show_completed
+    tasks = (t for t in tasks if show_completed or not t.is_completed)
 
-        folder = args.folder
-        if folder:
-            # Folder support is group-based; best-effort filter by group name.
-            tasks = await client.filter_tasks_by_folder_name(tasks, folder_name=folder)
+    if folder:
+        # Folder support is group-based; best-effort filter by group name.
+        tasks = await client.filter_tasks_by_folder_name(tasks, folder_name=folder)
 
-        for t in tasks:
-            due = t.due_date.isoformat() if t.due_date else ""
-            status = "x" if t.is_completed else " "
-            print(f"[{status}] {t.id}  {t.title}  {due}")
-        return ExitCode.OK
-    finally:
-        await client.close()
+    _print_tasks(tasks, args.json)
+    return EXIT_OK
 
 
 async def cmd_tasks_add(args: argparse.Namespace) -> int:
+    titles = list(args.task_title)
+    if args.from_file:
+        with open(args.from_file, encoding="utf-8") as f:
+            titles.extend(line.strip() for line in f if line.strip())
+    if not titles:
+        raise ValueError("No task titles given")
+
     client = await _build_client_from_tokens()
-    try:
-        project = await client.resolve_project_by_name(args.list)
-        due_dt = _parse_date_or_datetime(args.date) if args.date else None
+    project = await client.resolve_project_by_name(args.list)
 
-        task = Task(id="", title=args.task_title, project_id=project.id, due_date=due_dt)
-        created = await client.create_task(task)
-        print(created.id)
-        return ExitCode.OK
-    finally:
-        await client.close()
+    # Create concurrently, but keep the number in flight within the pool.
+    slots = asyncio.Semaphore(client.MAX_KEEPALIVE_CONNECTIONS)
+
+    async def create(title: str) -> Task:
+        async with slots:
+            task = Task(id="", title=title, project_id=project.id, due_date=args.date)
+            return await client.create_task(task)
+
+    def report(title: str, result: Task | BaseException) -> str:
+        if isinstance(result, Task):
+            return result.id
+        # Keep to one line; httpx's error messages run to two.
+        reason = str(result).partition("\n")[0]
+        return f"Error: could not create {title!r}: {reason}"
+
+    results = await asyncio.gather(*(create(t) for t in titles), return_exceptions=True)
+    # One line per title, in input order, so ids can be matched up.
+    _write_lines(report(title, r) for title, r in zip(titles, results))
+    if any(isinstance(r, BaseException) for r in results):
+        return EXIT_ERROR
+    return EXIT_OK
 
 
 async def cmd_tasks_edit(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
+    # The full task is still fetched so the update doesn't clear other fields.
+    if args.project_id:
+        task = await client.get_task(args.project_id, args.task_id)
+    else:
         task = await client.get_task_any_project(args.task_id)
-        if args.title:
-            task.title = args.title
-        if args.date is not None:
-            task.due_date = _parse_date_or_datetime(args.date)
-        updated = await client.update_task(task)
-        print(updated.id)
-        return ExitCode.OK
-    finally:
-        await client.close()
+    if args.title:
+        task.title = args.title
+    if args.date is not None:
+        task.due_date = args.date
+    updated = await client.update_task(task)
+    print(updated.id)
+    return EXIT_OK
 
 
 async def cmd_tasks_delete(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        task = await client.get_task_any_project(args.task_id)
-        await client.delete_task(task.project_id, task.id)
-        return ExitCode.OK
-    finally:
-        await client.close()
+    if args.project_id:
+        await client.delete_task(args.project_id, args.task_id)
+        return EXIT_OK
+    task = await client.get_task_any_project(args.task_id)
+    await client.delete_task(task.project_id, task.id)
+    return EXIT_OK
 
 
 async def cmd_tasks_complete(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        task = await client.get_task_any_project(args.task_id)
-        await client.complete_task(task.project_id, task.id)
-        return ExitCode.OK
-    finally:
-        await client.close()
+    if args.project_id:
+        await client.complete_task(args.project_id, args.task_id)
+        return EXIT_OK
+    task = await client.get_task_any_project(args.task_id)
+    await client.complete_task(task.project_id, task.id)
+    return EXIT_OK
 
 
 async def cmd_today_list(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        tasks = await client.get_tasks_for_today(include_completed=args.show_completed)
-        for t in tasks:
-            due = t.due_date.isoformat() if t.due_date else ""
-            status = "x" if t.is_completed else " "
-            print(f"[{status}] {t.id}  {t.title}  {due}")
-        return ExitCode.OK
-    finally:
-        await client.close()
+    tasks = await client.get_tasks_for_today(include_completed=args.show_completed)
+    _print_tasks(tasks, args.json)
+    return EXIT_OK
 
 
 async def cmd_today_add(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        project = await client.resolve_project_by_name(args.list)
-        due_dt = datetime.now()  # today
-        task = Task(id="", title=args.task_title, project_id=project.id, due_date=due_dt)
-        created = await client.create_task(task)
-        print(created.id)
-        return ExitCode.OK
-    finally:
-        await client.close()
+    project = await client.resolve_project_by_name(args.list)
+    due_dt = datetime.now()  # today
+    task = Task(id="", title=args.task_title, project_id=project.id, due_date=due_dt)
+    created = await client.create_task(task)
+    print(created.id)
+    return EXIT_OK
 
 
 async def cmd_inbox_list(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        inbox = await client.resolve_inbox_project()
-        tasks = await client.get_project_tasks(inbox.id)
-
-        if not args.show_completed:
-            tasks = [t for t in tasks if not t.is_completed]
+    inbox = await client.resolve_inbox_project()
+    tasks = await client.get_project_tasks(inbox.id)
 
-        for t in tasks:
-            due = t.due_date.isoformat() if t.due_date else ""
-            status = "x" if t.is_completed else " "
-            print(f"[{status}] {t.id}  {t.title}  {due}")
-        return ExitCode.OK
-    finally:
-        await client.close()
+    show_completed = args.show_completed
+    _print_tasks((t for t in tasks if show_completed or not t.is_completed), args.json)
+    return EXIT_OK
 
 
 async def cmd_inbox_add(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        inbox = await client.resolve_inbox_project()
-        due_dt = _parse_date_or_datetime(args.date) if args.date else None
-        task = Task(id="", title=args.task_title, project_id=inbox.id, due_date=due_dt)
-        created = await client.create_task(task)
-        print(created.id)
-        return ExitCode.OK
-    finally:
-        await client.close()
+    inbox = await client.resolve_inbox_project()
+    task = Task(id="", title=args.task_title, project_id=inbox.id, due_date=args.date)
+    created = await client.create_task(task)
+    print(created.id)
+    return EXIT_OK
 
 
 async def cmd_lists_list(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        projects = await client.get_projects()
-        for p in projects:
-            print(f"{p.id}  {p.name}")
-        return ExitCode.OK
-    finally:
-        await client.close()
+    projects = await client.get_projects()
+    if args.json:
+        _write_json(projects)
+    else:
+        _write_lines(f"{p.id}  {p.name}" for p in projects)
+    return EXIT_OK
 
 
-async def cmd_lists_add(args: argparse.Namespace) -> int:
+def cmd_lists_add(args: argparse.Namespace) -> int:
     # Not in Open API; provide a clear message.
     raise RuntimeError("Creating lists/projects is not supported by TickTick Open API.")
 
 
-async def cmd_lists_rename(args: argparse.Namespace) -> int:
+def cmd_lists_rename(args: argparse.Namespace) -> int:
     raise RuntimeError("Renaming lists/projects is not supported by TickTick Open API.")
 
 
-async def cmd_lists_delete(args: argparse.Namespace) -> int:
+def cmd_lists_delete(args: argparse.Namespace) -> int:
     raise RuntimeError("Deleting lists/projects is not supported by TickTick Open API.")
 
 
 async def cmd_folder_list(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        groups = await client.get_groups()
-        for g in groups:
-            print(f"{g['id']}  {g.get('name','')}")
-        return ExitCode.OK
-    finally:
-        await client.close()
+    groups = await client.get_groups()
+    _write_lines(f"{g['id']}  {g.get('name','')}" for g in groups)
+    return EXIT_OK
 
 
-async def cmd_folder_add(args: argparse.Namespace) -> int:
+def cmd_folder_add(args: argparse.Namespace) -> int:
     raise RuntimeError("Creating folders/groups is not supported by TickTick Open API.")
 
 
-async def cmd_folder_rename(args: argparse.Namespace) -> int:
+def cmd_folder_rename(args: argparse.Namespace) -> int:
     raise RuntimeError("Renaming folders/groups is not supported by TickTick Open API.")
 
 
-async def cmd_folder_delete(args: argparse.Namespace) -> int:
+def cmd_folder_delete(args: argparse.Namespace) -> int:
     raise RuntimeError("Deleting folders/groups is not supported by TickTick Open API.")
 
 
 async def cmd_tags_list(args: argparse.Namespace) -> int:
     client = await _build_client_from_tokens()
-    try:
-        tags = await client.get_tags()
-        for tag in tags:
-            print(tag)
-        return ExitCode.OK
-    finally:
-        await client.close()
+    tags = await client.get_tags()
+    _write_lines(tags)
+    return EXIT_OK
 
 
-async def cmd_tags_add(args: argparse.Namespace) -> int:
+def cmd_tags_add(args: argparse.Namespace) -> int:
     raise RuntimeError("Tag management is not supported by TickTick Open API.")
 
 
-async def cmd_tags_rename(args: argparse.Namespace) -> int:
+def cmd_tags_rename(args: argparse.Namespace) -> int:
     raise RuntimeError("Tag management is not supported by TickTick Open API.")
 
 
-async def cmd_tags_delete(args: argparse.Namespace) -> int:
+def cmd_tags_delete(args: argparse.Namespace) -> int:
     raise RuntimeError("Tag management is not supported by TickTick Open API.")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="ticktui")
-
-    sub = parser.add_subparsers(dest="command", required=True)
+_PROJECT_ID_HELP = "Project the task belongs to; skips searching every project for it"
+_JSON_HELP = "Print the results as a JSON array"
 
-    # tasks
-    tasks = sub.add_parser("tasks")
-    tasks_sub = tasks.add_subparsers(dest="tasks_command", required=True)
 
+def _add_tasks_commands(tasks_sub: argparse._SubParsersAction) -> None:
     tasks_list = tasks_sub.add_parser("list")
     tasks_list.add_argument(
         "--list",
@@ -307,32 +380,40 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include completed tasks in output",
     )
+    tasks_list.add_argument("--json", dest="json", action="store_true", help=_JSON_HELP)
     tasks_list.set_defaults(func=cmd_tasks_list)
 
     tasks_add = tasks_sub.add_parser("add")
-    tasks_add.add_argument("task_title")
-    tasks_add.add_argument("--date", dest="date", default=None)
+    tasks_add.add_argument("task_title", nargs="*", help="One or more task titles")
+    tasks_add.add_argument(
+        "--from-file",
+        dest="from_file",
+        default=None,
+        help="Also add one task per non-empty line of this file",
+    )
+    tasks_add.add_argument("--date", dest="date", default=None, type=_parse_date_or_datetime)
     tasks_add.add_argument("--list", dest="list", required=True)
     tasks_add.set_defaults(func=cmd_tasks_add)
 
     tasks_edit = tasks_sub.add_parser("edit")
     tasks_edit.add_argument("task_id")
     tasks_edit.add_argument("--title", dest="title", default=None)
-    tasks_edit.add_argument("--date", dest="date", default=None)
+    tasks_edit.add_argument("--date", dest="date", default=None, type=_parse_date_or_datetime)
+    tasks_edit.add_argument("--project-id", dest="project_id", default=None, help=_PROJECT_ID_HELP)
     tasks_edit.set_defaults(func=cmd_tasks_edit)
 
     tasks_delete = tasks_sub.add_parser("delete")
     tasks_delete.add_argument("task_id")
+    tasks_delete.add_argument("--project-id", dest="project_id", default=None, help=_PROJECT_ID_HELP)
     tasks_delete.set_defaults(func=cmd_tasks_delete)
 
     tasks_complete = tasks_sub.add_parser("complete")
     tasks_complete.add_argument("task_id")
+    tasks_complete.add_argument("--project-id", dest="project_id", default=None, help=_PROJECT_ID_HELP)
     tasks_complete.set_defaults(func=cmd_tasks_complete)
 
-    # today
-    today = sub.add_parser("today")
-    today_sub = today.add_subparsers(dest="today_command", required=True)
 
+def _add_today_commands(today_sub: argparse._SubParsersAction) -> None:
     today_list = today_sub.add_parser("list")
     today_list.add_argument(
         "--show-completed",
@@ -340,6 +421,7 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include completed tasks in output",
     )
+    today_list.add_argument("--json", dest="json", action="store_true", help=_JSON_HELP)
     today_list.set_defaults(func=cmd_today_list)
 
     today_add = today_sub.add_parser("add")
@@ -347,10 +429,8 @@ def build_parser() -> argparse.ArgumentParser:
     today_add.add_argument("--list", dest="list", required=True)
     today_add.set_defaults(func=cmd_today_add)
 
-    # inbox
-    inbox = sub.add_parser("inbox")
-    inbox_sub = inbox.add_subparsers(dest="inbox_command", required=True)
 
+def _add_inbox_commands(inbox_sub: argparse._SubParsersAction) -> None:
     inbox_list = inbox_sub.add_parser("list")
     inbox_list.add_argument(
         "--show-completed",
@@ -358,18 +438,18 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include completed tasks in output",
     )
+    inbox_list.add_argument("--json", dest="json", action="store_true", help=_JSON_HELP)
     inbox_list.set_defaults(func=cmd_inbox_list)
 
     inbox_add = inbox_sub.add_parser("add")
     inbox_add.add_argument("task_title")
-    inbox_add.add_argument("--date", dest="date", default=None)
+    inbox_add.add_argument("--date", dest="date", default=None, type=_parse_date_or_datetime)
     inbox_add.set_defaults(func=cmd_inbox_add)
 
-    # lists
-    lists = sub.add_parser("lists")
-    lists_sub = lists.add_subparsers(dest="lists_command", required=True)
 
+def _add_lists_commands(lists_sub: argparse._SubParsersAction) -> None:
     lists_list = lists_sub.add_parser("list")
+    lists_list.add_argument("--json", dest="json", action="store_true", help=_JSON_HELP)
     lists_list.set_defaults(func=cmd_lists_list)
 
     lists_add = lists_sub.add_parser("add")
@@ -385,10 +465,8 @@ def build_parser() -> argparse.ArgumentParser:
     lists_delete.add_argument("tag_name")
     lists_delete.set_defaults(func=cmd_lists_delete)
 
-    # folder
-    folder = sub.add_parser("folder")
-    folder_sub = folder.add_subparsers(dest="folder_command", required=True)
 
+def _add_folder_commands(folder_sub: argparse._SubParsersAction) -> None:
     folder_list = folder_sub.add_parser("list")
     folder_list.set_defaults(func=cmd_folder_list)
 
@@ -405,10 +483,8 @@ def build_parser() -> argparse.ArgumentParser:
     folder_delete.add_argument("tag_name")
     folder_delete.set_defaults(func=cmd_folder_delete)
 
-    # tags
-    tags = sub.add_parser("tags")
-    tags_sub = tags.add_subparsers(dest="tags_command", required=True)
 
+def _add_tags_commands(tags_sub: argparse._SubParsersAction) -> None:
     tags_list = tags_sub.add_parser("list")
     tags_list.set_defaults(func=cmd_tags_list)
 
@@ -425,18 +501,68 @@ def build_parser() -> argparse.ArgumentParser:
     tags_delete.add_argument("tag_name")
     tags_delete.set_defaults(func=cmd_tags_delete)
 
+
+# Top-level command groups and the functions registering their subcommands.
+_COMMAND_GROUPS = {
+    "tasks": _add_tasks_commands,
+    "today": _add_today_commands,
+    "inbox": _add_inbox_commands,
+    "lists": _add_lists_commands,
+    "folder": _add_folder_commands,
+    "tags": _add_tags_commands,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, once per process; parse_args doesn't mutate it.
+
+    Given a `command` group, only that group's subcommands are registered.
+    The other groups are still listed (for help and usage errors), but
+    building their ~30 leaf parsers is skipped for a command that can't
+    reach them.
+    """
+    parser = argparse.ArgumentParser(prog="ticktui")
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, add_commands in _COMMAND_GROUPS.items():
+        group = sub.add_parser(name)
+        if command is None or command == name:
+            add_commands(group.add_subparsers(dest=f"{name}_command", required=True))
+
     return parser
 
 
+def _loop_factory():
+    """Return uvloop's loop factory if it's installed, else None (asyncio's default)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main(argv: Optional[list[str]] = None) -> None:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    command = argv[0] if argv and argv[0] in _COMMAND_GROUPS else None
+    args = build_parser(command).parse_args(argv)
+
+    if not inspect.iscoroutinefunction(args.func):
+        # Unsupported commands are plain functions that just raise; report
+        # that without starting an event loop.
+        try:
+            raise SystemExit(args.func(args))
+        except Exception as e:  # noqa: BLE001
+            print(f"Error: {e}")
+            raise SystemExit(EXIT_ERROR)
 
     async def _runner() -> int:
         try:
-            return await args.func(args)
+            async with cli_session():
+                return await args.func(args)
         except Exception as e:  # noqa: BLE001
             print(f"Error: {e}")
-            return ExitCode.ERROR
+            return EXIT_ERROR
 
-    raise SystemExit(asyncio.run(_runner()))
+    raise SystemExit(asyncio.run(_runner(), loop_factory=_loop_factory()))
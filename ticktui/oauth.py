@@ -1,222 +1,225 @@
 """OAuth2 redirect server for handling TickTick authentication callback."""
 
 import asyncio
+import html
 import webbrowser
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from datetime import datetime
+from http import HTTPStatus
 from urllib.parse import urlparse, parse_qs
-from threading import Thread
 from typing import Optional
 import socket
 
+from .api import TickTickAuth
 
-class OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for OAuth callback."""
-    
-    # Class-level storage for the authorization code
-    auth_code: Optional[str] = None
-    auth_state: Optional[str] = None
-    error: Optional[str] = None
-    callback_received = asyncio.Event()
-    
-    def log_message(self, format, *args):
-        """Suppress default logging."""
-        pass
-    
-    def do_GET(self):
-        """Handle GET request (OAuth callback)."""
-        parsed = urlparse(self.path)
-        
-        if parsed.path == "/callback":
-            params = parse_qs(parsed.query)
-            
-            if "code" in params:
-                OAuthCallbackHandler.auth_code = params["code"][0]
-                OAuthCallbackHandler.auth_state = params.get("state", [None])[0]
-                self._send_success_response()
-            elif "error" in params:
-                OAuthCallbackHandler.error = params.get("error_description", params["error"])[0]
-                self._send_error_response(OAuthCallbackHandler.error)
-            else:
-                OAuthCallbackHandler.error = "No authorization code received"
-                self._send_error_response(OAuthCallbackHandler.error)
-        else:
-            self.send_error(404, "Not Found")
-    
-    def _send_success_response(self):
-        """Send a success HTML response."""
-        self.send_response(200)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
-        
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>TickTUI - Authorization Successful</title>
-            <style>
-                body {
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                    margin: 0;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                }
-                .container {
-                    text-align: center;
-                    padding: 2rem;
-                    background: rgba(255, 255, 255, 0.1);
-                    border-radius: 16px;
-                    backdrop-filter: blur(10px);
-                }
-                h1 { margin-bottom: 0.5rem; }
-                p { opacity: 0.9; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Authorization Successful!</h1>
-                <p>You can close this window and return to TickTUI.</p>
-            </div>
-        </body>
-        </html>
-        """
-        self.wfile.write(html.encode())
-    
-    def _send_error_response(self, error: str):
-        """Send an error HTML response."""
-        self.send_response(400)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>TickTUI - Authorization Failed</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                    margin: 0;
-                    background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
-                    color: white;
-                }}
-                .container {{
-                    text-align: center;
-                    padding: 2rem;
-                    background: rgba(255, 255, 255, 0.1);
-                    border-radius: 16px;
-                    backdrop-filter: blur(10px);
-                }}
-                h1 {{ margin-bottom: 0.5rem; }}
-                p {{ opacity: 0.9; }}
-                .error-icon {{
-                    font-size: 4rem;
-                    margin-bottom: 1rem;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="error-icon">✗</div>
-                <h1>Authorization Failed</h1>
-                <p>{error}</p>
-                <p>Please close this window and try again.</p>
-            </div>
-        </body>
-        </html>
-        """
-        self.wfile.write(html.encode())
+
+# Pages shown in the browser after the redirect. The success page is encoded
+# once; the error page is a template with a single {error} placeholder.
+_SUCCESS_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>TickTUI - Authorization Successful</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+        }
+        .container {
+            text-align: center;
+            padding: 2rem;
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 16px;
+            backdrop-filter: blur(10px);
+        }
+        h1 { margin-bottom: 0.5rem; }
+        p { opacity: 0.9; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Authorization Successful!</h1>
+        <p>You can close this window and return to TickTUI.</p>
+    </div>
+</body>
+</html>
+""".encode()
+
+_ERROR_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>TickTUI - Authorization Failed</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+            color: white;
+        }}
+        .container {{
+            text-align: center;
+            padding: 2rem;
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 16px;
+            backdrop-filter: blur(10px);
+        }}
+        h1 {{ margin-bottom: 0.5rem; }}
+        p {{ opacity: 0.9; }}
+        .error-icon {{
+            font-size: 4rem;
+            margin-bottom: 1rem;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="error-icon">✗</div>
+        <h1>Authorization Failed</h1>
+        <p>{error}</p>
+        <p>Please close this window and try again.</p>
+    </div>
+</body>
+</html>
+"""
+
+
+# (auth_code, state, error) as received on the redirect
+CallbackResult = tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def _http_response(status: HTTPStatus, body: bytes, content_type: str = "text/html") -> bytes:
+    """Serialize a minimal HTTP/1.1 response that closes the connection."""
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("ascii") + body
 
 
 class OAuthRedirectServer:
-    """Local server to handle OAuth2 redirect callbacks."""
+    """Local server to handle OAuth2 redirect callbacks.
+
+    It runs on the caller's event loop: the first request to /callback
+    resolves the future that `wait_for_callback` awaits.
+    """
     
     def __init__(self, port: int = 8080, host: str = "localhost"):
         self.port = port
         self.host = host
-        self.server: Optional[HTTPServer] = None
-        self._thread: Optional[Thread] = None
+        self.server: Optional[asyncio.Server] = None
+        self._result: Optional[asyncio.Future[CallbackResult]] = None
     
     @property
     def redirect_uri(self) -> str:
         """Get the redirect URI for this server."""
         return f"http://{self.host}:{self.port}/callback"
     
-    def _find_available_port(self) -> int:
-        """Find an available port starting from self.port."""
+    async def _bind(self) -> asyncio.Server:
+        """Bind the server to the first free port from self.port onwards.
+
+        Binding the real server directly (rather than probing with a throwaway
+        socket first) means the port can't be taken in between. Port 0 lets
+        the OS pick one. IPv4 only, so a single socket owns the port.
+        """
+        if not self.port:
+            return await asyncio.start_server(self._handle, self.host, 0, family=socket.AF_INET)
         for port in range(self.port, self.port + 100):
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind((self.host, port))
-                    return port
+                return await asyncio.start_server(self._handle, self.host, port, family=socket.AF_INET)
             except OSError:
                 continue
         raise RuntimeError(f"No available ports found starting from {self.port}")
     
-    def start(self) -> int:
+    async def start(self) -> int:
         """Start the OAuth redirect server.
         
         Returns:
             The port the server is running on.
         """
-        # Reset handler state
-        OAuthCallbackHandler.auth_code = None
-        OAuthCallbackHandler.auth_state = None
-        OAuthCallbackHandler.error = None
-        
-        # Find available port
-        self.port = self._find_available_port()
-        
-        self.server = HTTPServer((self.host, self.port), OAuthCallbackHandler)
-        self._thread = Thread(target=self.server.serve_forever, daemon=True)
-        self._thread.start()
-        
+        self._result = asyncio.get_running_loop().create_future()
+        self.server = await self._bind()
+        self.port = self.server.sockets[0].getsockname()[1]
         return self.port
     
-    def stop(self):
+    async def stop(self):
         """Stop the OAuth redirect server."""
         if self.server:
-            self.server.shutdown()
+            self.server.close()
+            # Drop idle browser connections (e.g. speculative preconnects)
+            # so wait_closed doesn't wait on them.
+            self.server.close_clients()
+            await self.server.wait_closed()
             self.server = None
-        self._thread = None
     
-    def wait_for_callback(self, timeout: float = 300) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    async def wait_for_callback(self, timeout: float = 300) -> CallbackResult:
         """Wait for the OAuth callback.
         
         Args:
             timeout: Maximum time to wait in seconds.
             
         Returns:
-            Tuple of (auth_code, state, error)
+            Tuple of (auth_code, state, error); all None on timeout.
         """
-        import time
-        start = time.time()
-        
-        while time.time() - start < timeout:
-            if OAuthCallbackHandler.auth_code or OAuthCallbackHandler.error:
-                # Small delay to ensure response is sent to browser
-                time.sleep(0.2)
-                break
-            time.sleep(0.1)
-        
-        return (
-            OAuthCallbackHandler.auth_code,
-            OAuthCallbackHandler.auth_state,
-            OAuthCallbackHandler.error,
-        )
+        try:
+            return await asyncio.wait_for(self._result, timeout)
+        except TimeoutError:
+            return None, None, None
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one request, recording the outcome if it's the callback."""
+        try:
+            request_line = await reader.readline()
+            # Skip the headers; nothing in them is needed.
+            while (await reader.readline()).strip():
+                pass
+            
+            parts = request_line.split()
+            target = parts[1].decode("latin-1") if len(parts) >= 2 else ""
+            parsed = urlparse(target)
+            if parsed.path != "/callback":
+                writer.write(_http_response(HTTPStatus.NOT_FOUND, b"Not Found", "text/plain"))
+                await writer.drain()
+                return
+            
+            params = parse_qs(parsed.query)
+            if "code" in params:
+                result = (params["code"][0], params.get("state", [None])[0], None)
+                response = _http_response(HTTPStatus.OK, _SUCCESS_HTML)
+            else:
+                if "error" in params:
+                    error = params.get("error_description", params["error"])[0]
+                else:
+                    error = "No authorization code received"
+                result = (None, None, error)
+                body = _ERROR_HTML.format(error=html.escape(error)).encode()
+                response = _http_response(HTTPStatus.BAD_REQUEST, body)
+            
+            writer.write(response)
+            await writer.drain()
+            if self._result is not None and not self._result.done():
+                self._result.set_result(result)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
 
 
 async def perform_oauth_flow(
     client_id: str,
     client_secret: str,
-) -> tuple[Optional[str], Optional[str], Optional[str]]:
+) -> tuple[Optional[str], Optional[str], Optional[datetime], Optional[str]]:
     """Perform the complete OAuth2 flow.
     
     Args:
@@ -224,38 +227,33 @@ async def perform_oauth_flow(
         client_secret: TickTick API client secret
         
     Returns:
-        Tuple of (access_token, refresh_token, error)
+        Tuple of (access_token, refresh_token, token_expiry, error)
     """
-    from .api import TickTickAuth
-    
     # Start local server
     server = OAuthRedirectServer()
-    server.start()
+    await server.start()
+    
+    # Create auth handler with correct redirect URI
+    auth = TickTickAuth(client_id, client_secret, server.redirect_uri)
     
     try:
-        # Create auth handler with correct redirect URI
-        auth = TickTickAuth(client_id, client_secret, server.redirect_uri)
-        
         # Generate authorization URL
         auth_url, state = auth.get_authorization_url()
         
         # Open browser
         webbrowser.open(auth_url)
         
-        # Wait for callback in a thread to not block the event loop
-        code, returned_state, error = await asyncio.to_thread(
-            server.wait_for_callback, 300
-        )
+        code, returned_state, error = await server.wait_for_callback(300)
         
         if error:
-            return None, None, error
+            return None, None, None, error
         
         if not code:
-            return None, None, "Authorization timed out"
+            return None, None, None, "Authorization timed out"
         
         # Verify state
         if returned_state != state:
-            return None, None, "State mismatch - possible CSRF attack"
+            return None, None, None, "State mismatch - possible CSRF attack"
         
         # Exchange code for token
         token_data = await auth.exchange_code(code)
@@ -263,8 +261,10 @@ async def perform_oauth_flow(
         return (
             token_data.get("access_token"),
             token_data.get("refresh_token"),
+            auth.token_expiry,
             None,
         )
         
     finally:
-        server.stop()
+        await server.stop()
+        await auth.aclose()